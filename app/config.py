@@ -1,4 +1,5 @@
 """Configuration settings for the BibleEngine API."""
+from functools import cached_property
 from pydantic_settings import BaseSettings
 from typing import List, Optional
 
@@ -10,6 +11,12 @@ class Settings(BaseSettings):
     database_url: str
     secret_key: str
     wiki_base_url: str = "https://bible.world"
+    wiki_cache_ttl: float = 300  # seconds to reuse a wiki page or search result
+    
+    # Database pool settings
+    db_pool_min: int = 10
+    db_pool_max: int = 50
+    db_pool_recycle: int = 3600  # seconds; reconnect before MySQL's wait_timeout
     
     # CORS settings
     cors_origins: str = "*"  # Comma-separated list of allowed origins
@@ -18,20 +25,39 @@ class Settings(BaseSettings):
     api_title: str = "BibleEngine API"
     api_version: str = "1.0.0"
     
+    # Search settings
+    # Use MATCH ... AGAINST for keyword search; requires the ngram FULLTEXT
+    # index from migrations/001_bible_search_fulltext.sql
+    fulltext_search: bool = False
+    # Shortest keyword the index can match; must equal the server's
+    # ngram_token_size. Shorter keywords fall back to LIKE (a table scan)
+    fulltext_min_token_size: int = 2
+    # Seconds to serve repeated searches from memory; likes shown in cached
+    # results may lag by up to this long
+    search_cache_ttl: float = 300
+    
+    # Likes settings
+    # When set, likes are counted in Redis and flushed to MySQL periodically
+    redis_url: Optional[str] = None
+    likes_flush_interval: float = 5.0  # seconds
+    
+    # Server settings (used by `python main.py`)
+    workers: int = 0  # uvicorn worker processes; 0 = one per CPU core
+    
     # Logging
     log_level: str = "INFO"  # DEBUG, INFO, WARNING, ERROR
     
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production environment."""
         return self.environment.lower() == "production"
     
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development environment."""
         return self.environment.lower() == "development"
     
-    @property
+    @cached_property
     def allowed_origins(self) -> List[str]:
         """Get list of allowed CORS origins."""
         if self.cors_origins == "*":
@@ -1,17 +1,20 @@
 """Pydantic models for API requests and responses."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 
 
 class VerseResult(BaseModel):
     """Single verse result."""
+    # Results are built once per row and never modified
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     reference: str
     text: str
     book: int
     chapter: int
     verse: int
-    translation: Optional[str] = None
-    likes: Optional[int] = 0
+    translation: Optional[str] = None  # None for keyword search results
+    likes: int = 0
 
 
 class SearchResponse(BaseModel):
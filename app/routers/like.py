@@ -2,6 +2,7 @@
 from fastapi import APIRouter, HTTPException
 from app.models import LikeRequest, LikeResponse
 from app.database import db
+from app.utils.like_utils import buffer_like
 
 router = APIRouter()
 
@@ -14,49 +15,36 @@ async def like_verse(request: LikeRequest):
     - POST /v1/api/like with body: {"book": 43, "chapter": 3, "verse": 16}
     """
     try:
-        # Update likes count (MySQL doesn't support RETURNING, so we do it in two steps)
-        update_query = """
-            UPDATE bible_books
-            SET likes = likes + 1
-            WHERE book = %s AND chapter = %s AND verse = %s
-        """
-        
-        await db.execute(
-            update_query,
-            request.book,
-            request.chapter,
-            request.verse
-        )
-        
-        # Get updated likes count
-        select_query = """
-            SELECT likes
-            FROM bible_books
-            WHERE book = %s AND chapter = %s AND verse = %s
-        """
-        
-        result = await db.fetch_one(
-            select_query,
-            request.book,
-            request.chapter,
-            request.verse
-        )
-        
-        if result:
-            return LikeResponse(
-                success=True,
-                likes=result['likes']
-            )
+        if db.redis is not None:
+            # Buffer the like in Redis; it is flushed to MySQL in the background
+            likes = await buffer_like(request.book, request.chapter, request.verse)
         else:
-            # Verse not found, but don't error - just return 0
-            return LikeResponse(
-                success=True,
-                likes=0
+            # MySQL doesn't support RETURNING; LAST_INSERT_ID(expr) stores the new
+            # count in the session so it comes back with the upsert's OK packet.
+            # Selecting from bible_books only likes verses that exist.
+            upsert_query = """
+                INSERT INTO bible_likes (book, chapter, verse, likes)
+                SELECT book, chapter, verse, LAST_INSERT_ID(1)
+                FROM bible_books
+                WHERE book = %s AND chapter = %s AND verse = %s
+                ON DUPLICATE KEY UPDATE likes = LAST_INSERT_ID(bible_likes.likes + 1)
+            """
+            
+            likes = await db.execute_returning_insert_id(
+                upsert_query,
+                request.book,
+                request.chapter,
+                request.verse
             )
+        
+        # Verse not found, but don't error - just return 0
+        return LikeResponse(
+            success=True,
+            likes=likes if likes is not None else 0
+        )
             
     except Exception as e:
         return LikeResponse(
             success=False,
             error=str(e)
         )
-
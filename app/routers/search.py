@@ -1,14 +1,414 @@
 """Search API router for verse search."""
+import asyncio
+import logging
+import aiomysql
+from async_lru import alru_cache
 from fastapi import APIRouter, Query, HTTPException
-from typing import Optional, List
+from fastapi.responses import HTMLResponse, ORJSONResponse, PlainTextResponse, Response
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Optional, List, Dict, Tuple, Any, Callable, Mapping
 from app.models import SearchResponse, VerseResult
+from app.config import settings
 from app.database import db
+from app.utils.like_utils import get_pending_likes
 from app.utils.query_parser import parse_query
-from app.utils.book_utils import get_book_short, get_book_english, get_book_chapter_count
+from app.utils.book_utils import (
+    BOOK_SHORT, VERSE_COUNTS, get_book_short, get_book_english,
+    get_book_chapter_count, get_max_verse
+)
 from app.utils.text_utils import process_bible_text
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Translations stored as columns of the main bible_books table
+MAIN_TABLE_COLUMNS = MappingProxyType({
+    'cuvs': 'txt_cn',
+    'cuvt': 'txt_tw',
+    'pinyin': 'txt_py',
+})
+
+# Translations stored in their own bible_book_{code} table
+TRANSLATION_TABLE_CODES = (
+    'kjv', 'nasb', 'esv', 'cuvc', 'kjv1611', 'ncvs', 'lcvs', 'ccsb', 'clbs',
+    'ckjvs', 'ckjvt', 'ukjv', 'tcvs', 'tr', 'wlc', 'bbe', 'nstrunv',
+)
+
+
+def _build_select_queries() -> Mapping[str, str]:
+    """Build the verse range query for every separate translation table.
+    
+    Table names come from the whitelist above, so the interpolation is safe
+    and happens once at import. The result is read-only.
+    """
+    queries = {}
+    for trans in TRANSLATION_TABLE_CODES:
+        queries[trans] = f"""
+            SELECT Book as book, Chapter as chapter, Verse as verse, Scripture as txt
+            FROM bible_book_{trans}
+            WHERE Book = %s
+            AND Chapter = %s
+            AND Verse >= %s
+            AND Verse <= %s
+            ORDER BY Verse
+        """
+    return MappingProxyType(queries)
+
+
+_SELECT_QUERIES = _build_select_queries()
+
+# Verse rows are read by position: every text query selects
+# book, chapter, verse first, followed by the text column(s)
+TEXT_COLUMN_OFFSET = 3
+
+# Last verse of every chapter; loaded at startup
+VERSE_COUNTS_QUERY = """
+    SELECT book, chapter, MAX(verse)
+    FROM bible_books
+    GROUP BY book, chapter
+"""
+
+# Rows containing each keyword, from bible_keyword_freq; loaded at startup
+KEYWORD_FREQ_QUERY = "SELECT kw, cnt FROM bible_keyword_freq"
+# Frequency assumed for keywords missing from bible_keyword_freq: only the
+# keywords worth ranking are stored, so an unranked one may be very common
+UNRANKED_KEYWORD_FREQ = 10**9
+# MySQL error code for a missing table
+ER_NO_SUCH_TABLE = 1146
+_keyword_freq: Dict[str, int] = {}
+
+# Translations searched when the request doesn't name any
+DEFAULT_TRANSLATIONS = ('cuvs', 'cuvt', 'kjv', 'nasb')
+
+# Result sets at least this large are processed in a worker thread
+PROCESS_IN_THREAD_MIN_ROWS = 16
+
+
+async def load_verse_counts():
+    """Load the last verse number of every chapter into VERSE_COUNTS."""
+    rows = await db.fetch_all_tuples(VERSE_COUNTS_QUERY)
+    VERSE_COUNTS.update(((book, chapter), max_verse) for book, chapter, max_verse in rows)
+
+
+async def load_keyword_freq():
+    """Load keyword frequencies used to order LIKE predicates.
+    
+    The table is optional (migrations/003_bible_keyword_freq.sql); without
+    it keywords keep their query order.
+    """
+    global _keyword_freq
+    try:
+        rows = await db.fetch_all_tuples(KEYWORD_FREQ_QUERY)
+    except aiomysql.ProgrammingError as e:
+        if e.args and e.args[0] == ER_NO_SUCH_TABLE:
+            logger.info("bible_keyword_freq not found; keywords keep their query order")
+            return
+        raise
+    _keyword_freq = dict(rows)
+
+
+@lru_cache(maxsize=None)
+def _main_table_query(txt_columns: Tuple[str, ...]) -> str:
+    """Build one bible_books query selecting all requested txt columns.
+    
+    Translations that live in bible_books share the same rows, so they are
+    fetched together instead of one query per translation. The txt columns
+    follow book, chapter, verse in the given order.
+    """
+    return f"""
+        SELECT book, chapter, verse, {', '.join(txt_columns)}
+        FROM bible_books
+        WHERE book = %s
+        AND chapter = %s
+        AND verse >= %s
+        AND verse <= %s
+        ORDER BY verse
+    """
+
+
+@lru_cache(maxsize=128)
+def _likes_query(verse_count: int) -> str:
+    """Build the likes lookup for a number of (book, chapter, verse) keys.
+    
+    Likes are kept out of every cached query and read per request. Verses
+    without a bible_likes row have 0 likes and are simply not returned.
+    """
+    keys = ", ".join(["(%s, %s, %s)"] * verse_count)
+    return f"""
+        SELECT book, chapter, verse, likes
+        FROM bible_likes
+        WHERE (book, chapter, verse) IN ({keys})
+    """
+
+
+@lru_cache(maxsize=256)
+def _keyword_query(has_match: bool, like_count: int) -> str:
+    """Build the keyword search query for one query shape.
+    
+    The SQL text depends only on whether there is a MATCH clause and the
+    number of LIKE keywords, so each shape is built once. Placeholders, in
+    order: the relevance score's MATCH expression, the book filter (twice,
+    NULL for all books), the WHERE MATCH expression, then one LIKE pattern
+    per short keyword.
+    """
+    # aiomysql inlines parameters, so with a NULL book the server folds
+    # this to TRUE, and with a book it is a plain PK prefix condition
+    conditions = ["(%s IS NULL OR s.book = %s)"]
+    
+    select_score = ""
+    order_by = "s.book, s.chapter, s.verse"
+    if has_match:
+        conditions.append("MATCH(s.txt) AGAINST (%s IN BOOLEAN MODE)")
+        # Rank by relevance
+        select_score = ", MATCH(s.txt) AGAINST (%s IN BOOLEAN MODE) as score"
+        order_by = f"score DESC, {order_by}"
+    
+    conditions.extend(["s.txt LIKE %s"] * like_count)
+    where_clause = " AND ".join(conditions)
+    
+    # Rows are read by position. bible_search is keyed on (book, chapter,
+    # verse), so rows are unique without DISTINCT. Likes are not selected:
+    # results are cached, and fetch_likes reads them per request
+    return f"""
+        SELECT s.book, s.chapter, s.verse, s.txt{select_score}
+        FROM bible_search s
+        WHERE {where_clause}
+        ORDER BY {order_by}
+        LIMIT 100
+    """
+
+
+@alru_cache(maxsize=10000)
+async def _load_verses(
+    query: str,
+    book_id: int,
+    chapter: int,
+    verse_min: int,
+    verse_max: int
+) -> Tuple[Tuple[Any, ...], ...]:
+    """Load verse text rows, cached in-process.
+    
+    Bible text is immutable, so repeated lookups (John 3:16 etc.) are served
+    from memory. Rows are positional tuples and never include likes.
+    """
+    rows = await db.fetch_all_tuples(query, book_id, chapter, verse_min, verse_max)
+    return tuple(rows)
+
+
+def _process_batch(
+    texts: List[str],
+    queries: Optional[List[str]],
+    strongs: bool
+) -> List[str]:
+    """Run process_bible_text over a batch of raw verse texts."""
+    return [
+        process_bible_text(text=text, queries=queries, strongs=strongs)
+        for text in texts
+    ]
+
+
+async def _process_texts(
+    texts: List[str],
+    queries: Optional[List[str]],
+    strongs: bool
+) -> List[str]:
+    """Process verse texts, off the event loop for larger batches.
+    
+    Small batches are processed inline since a thread hop costs more than
+    the regex work for a handful of verses.
+    """
+    if len(texts) < PROCESS_IN_THREAD_MIN_ROWS:
+        return _process_batch(texts, queries, strongs)
+    return await asyncio.to_thread(_process_batch, texts, queries, strongs)
+
+
+async def fetch_likes(
+    verses: Tuple[Tuple[int, int, int], ...]
+) -> Dict[Tuple[int, int, int], int]:
+    """Read the current likes of verses; never cached.
+    
+    Args:
+        verses: (book, chapter, verse) tuples
+        
+    Returns:
+        Dictionary of (book, chapter, verse) to persisted likes plus likes
+        still buffered in Redis; verses with no likes are left out
+    """
+    if not verses:
+        return {}
+    
+    params = [value for verse in verses for value in verse]
+    rows, pending = await asyncio.gather(
+        db.fetch_all_tuples(_likes_query(len(verses)), *params),
+        get_pending_likes(verses)
+    )
+    likes = {(book, chapter, verse): count for book, chapter, verse, count in rows}
+    for verse, count in pending.items():
+        likes[verse] = likes.get(verse, 0) + count
+    return likes
+
+
+class _SearchResults:
+    """Results of one search, with renderings built on first use.
+    
+    Instances live in the _search cache, so repeated requests for a popular
+    search reuse the rendered data instead of rebuilding it. Results carry
+    text only (likes 0); current likes are merged in per request with
+    json_data.
+    """
+    
+    def __init__(self, results: Tuple[VerseResult, ...]):
+        self.results = results
+    
+    @cached_property
+    def data(self) -> List[Dict[str, Any]]:
+        """JSON-ready verse dicts for the default response format, without likes."""
+        return [r.model_dump() for r in self.results]
+    
+    @cached_property
+    def _row_like_keys(self) -> List[Optional[Tuple[int, int, int]]]:
+        """Verse key per result, or None for translations that carry no likes."""
+        return [
+            (r.book, r.chapter, r.verse)
+            if r.translation is None or r.translation.lower() in MAIN_TABLE_COLUMNS
+            else None
+            for r in self.results
+        ]
+    
+    @cached_property
+    def like_keys(self) -> Tuple[Tuple[int, int, int], ...]:
+        """Distinct verses whose likes are shown, for fetch_likes."""
+        return tuple(dict.fromkeys(key for key in self._row_like_keys if key))
+    
+    def json_data(self, likes: Dict[Tuple[int, int, int], int]) -> List[Dict[str, Any]]:
+        """JSON-ready verse dicts with current likes filled in.
+        
+        Only rows with likes are copied; the cached dicts are never modified.
+        """
+        if not likes:
+            return self.data
+        return [
+            {**row, 'likes': likes[key]} if key in likes else row
+            for row, key in zip(self.data, self._row_like_keys)
+        ]
+    
+    @cached_property
+    def text(self) -> str:
+        """Plain text rendering, one verse per line."""
+        return "\n".join(f"{r.reference}: {r.text}" for r in self.results)
+    
+    @cached_property
+    def html(self) -> str:
+        """HTML rendering, one paragraph per verse."""
+        return "".join(
+            f"<p><strong>{r.reference}</strong>: {r.text}</p>\n" for r in self.results
+        )
+
+
+def _format_text(search: _SearchResults) -> PlainTextResponse:
+    """Render results as plain text (for compatibility)."""
+    return PlainTextResponse(content=search.text)
+
+
+def _format_html(search: _SearchResults) -> HTMLResponse:
+    """Render results as HTML paragraphs (for compatibility)."""
+    return HTMLResponse(content=search.html)
+
+
+# Non-JSON response formats by `api` parameter; anything else returns JSON
+_FORMATTERS: Dict[str, Callable[[_SearchResults], Response]] = {
+    'text': _format_text,
+    'plain': _format_text,
+    'html': _format_html,
+}
+
+
+@alru_cache(maxsize=2048, ttl=settings.search_cache_ttl)
+async def _search(
+    q: Optional[str],
+    i: Optional[str],
+    translations: Tuple[str, ...],
+    b: Optional[int],
+    e: int,
+    strongs: bool
+) -> _SearchResults:
+    """Run a search and return its results, cached for SEARCH_CACHE_TTL seconds.
+    
+    Popular lookups (John 3:16 etc.) skip the text queries and processing
+    entirely. VerseResult is frozen, so cached results are safe to share.
+    Likes are not part of the cached results; search_verses reads them live
+    with fetch_likes. Failed searches are not cached.
+    """
+    results = []
+    
+    if i:
+        # Process index (verse references). Parse every reference before
+        # creating any fetch, so a malformed one raises before there are
+        # coroutines left un-awaited
+        verse_refs = [ref.strip() for ref in i.split(',')]
+        locations = []
+        for verse_ref in verse_refs:
+            parts = verse_ref.split(':')
+            if len(parts) >= 3:
+                locations.append((int(parts[0]), int(parts[1]), int(parts[2])))
+        
+        # Fetch all references concurrently; results keep request order
+        for verse_results in await asyncio.gather(*[
+            fetch_verses(
+                book_id=book_id,
+                chapter=chapter,
+                verse_start=verse,
+                verse_end=verse,
+                translations=translations,
+                context=e,
+                strongs=strongs
+            )
+            for book_id, chapter, verse in locations
+        ]):
+            results.extend(verse_results)
+    elif q:
+        # Parse query
+        parsed = parse_query(q)
+        
+        if parsed.type == 'reference':
+            # Verse reference search
+            book_id = parsed.book_id
+            chapter = parsed.chapter
+            verse_start = parsed.verse
+            verse_end = parsed.verse_end
+            
+            # Apply book filter if specified
+            if b and b != book_id:
+                return _SearchResults(())
+            
+            # Fetch verses
+            verse_results = await fetch_verses(
+                book_id=book_id,
+                chapter=chapter,
+                verse_start=verse_start,
+                verse_end=verse_end,
+                translations=translations,
+                context=e,
+                strongs=strongs
+            )
+            results.extend(verse_results)
+        else:
+            # Keyword search
+            keywords = parsed.keywords
+            
+            # Build search query
+            verse_results = await search_by_keywords(
+                keywords=keywords,
+                book_filter=b,
+                translations=translations,
+                strongs=strongs
+            )
+            results.extend(verse_results)
+    
+    return _SearchResults(tuple(results))
+
 
 @router.get("/search", response_model=SearchResponse)
 async def search_verses(
@@ -29,81 +429,14 @@ async def search_verses(
     - /v1/api/search?i=43:3:16,43:3:17
     """
     try:
-        results = []
-        
         # Determine which translations to search
-        translations = []
         if translation:
-            translations = [t.strip() for t in translation.split(',')]
+            translations = tuple(t.strip() for t in translation.split(','))
         else:
             # Default: search all available translations
-            translations = ['cuvs', 'cuvt', 'kjv', 'nasb']
+            translations = DEFAULT_TRANSLATIONS
         
-        if i:
-            # Process index (verse references)
-            verse_refs = [ref.strip() for ref in i.split(',')]
-            for verse_ref in verse_refs:
-                parts = verse_ref.split(':')
-                if len(parts) >= 3:
-                    book_id = int(parts[0])
-                    chapter = int(parts[1])
-                    verse = int(parts[2])
-                    
-                    # Fetch verses
-                    verse_results = await fetch_verses(
-                        book_id=book_id,
-                        chapter=chapter,
-                        verse_start=verse,
-                        verse_end=verse,
-                        translations=translations,
-                        context=e or 0,
-                        strongs=strongs
-                    )
-                    results.extend(verse_results)
-        elif q:
-            # Parse query
-            parsed = parse_query(q)
-            
-            if parsed['type'] == 'reference':
-                # Verse reference search
-                book_id = parsed['book_id']
-                chapter = parsed['chapter']
-                verse_start = parsed['verse']
-                verse_end = parsed['verse_end']
-                
-                # Apply book filter if specified
-                if b and b != book_id:
-                    return SearchResponse(
-                        success=True,
-                        data=[],
-                        count=0,
-                        query=q
-                    )
-                
-                # Fetch verses
-                verse_results = await fetch_verses(
-                    book_id=book_id,
-                    chapter=chapter,
-                    verse_start=verse_start,
-                    verse_end=verse_end,
-                    translations=translations,
-                    context=e or 0,
-                    strongs=strongs
-                )
-                results.extend(verse_results)
-            else:
-                # Keyword search
-                keywords = parsed['keywords']
-                
-                # Build search query
-                verse_results = await search_by_keywords(
-                    keywords=keywords,
-                    book_filter=b,
-                    translations=translations,
-                    strongs=strongs
-                )
-                results.extend(verse_results)
-        else:
+        if not i and not q:
             return SearchResponse(
                 success=False,
                 data=[],
@@ -111,28 +444,27 @@ async def search_verses(
                 query=None
             )
         
+        # q is ignored when i is given, so leave it out of the cache key
+        search = await _search(
+            None if i else q, i, translations, b, e or 0, bool(strongs)
+        )
+        
         # Format response based on API format
-        if api in ['text', 'plain']:
-            # Return plain text (for compatibility)
-            from fastapi.responses import PlainTextResponse
-            text_output = "\n".join([f"{r.reference}: {r.text}" for r in results])
-            return PlainTextResponse(content=text_output)
-        elif api == 'html':
-            # Return HTML (for compatibility)
-            from fastapi.responses import HTMLResponse
-            html_output = "".join([
-                f"<p><strong>{r.reference}</strong>: {r.text}</p>\n"
-                for r in results
-            ])
-            return HTMLResponse(content=html_output)
-        else:
-            # Default: JSON
-            return SearchResponse(
-                success=True,
-                data=results,
-                count=len(results),
-                query=q or i
-            )
+        formatter = _FORMATTERS.get(api)
+        if formatter is not None:
+            return formatter(search)
+        
+        # Default: JSON, the only format that shows likes; they change
+        # constantly, so they are read live rather than cached with the text.
+        # The envelope matches SearchResponse; encoding it directly skips
+        # re-validating every verse on the way out
+        likes = await fetch_likes(search.like_keys)
+        return ORJSONResponse({
+            'success': True,
+            'data': search.json_data(likes),
+            'count': len(search.results),
+            'query': q or i
+        })
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -163,82 +495,78 @@ async def fetch_verses(
     """
     results = []
     
-    # Calculate verse range with context
+    # References past the end of the chapter (or to a missing chapter)
+    # can't match anything, so skip the database
+    max_verse = get_max_verse(book_id, chapter)
+    if verse_start > max_verse:
+        return results
+    
+    # Calculate verse range with context, clamped to the chapter
     verse_min = max(1, verse_start - context)
-    verse_max = verse_end + context
-    
-    for trans in translations:
-        # Map translation codes to table names
-        # Some translations are in bible_books, others have separate tables
-        trans_lower = trans.lower()
-        table_map = {
-            'cuvs': 'bible_books',      # Uses txt_cn column
-            'cuvt': 'bible_books',      # Uses txt_tw column
-            'kjv': 'bible_book_kjv',    # Separate table (or bible_books txt_en)
-            'nasb': 'bible_book_nasb',  # Separate table
-            'esv': 'bible_book_esv',    # Separate table
-            'pinyin': 'bible_books'      # Uses txt_py column
-        }
-        
-        table = table_map.get(trans_lower, f'bible_book_{trans_lower}')
-        
-        # Build query (table name is from whitelist, so safe)
-        # Note: MySQL uses %s for parameter placeholders
-        # For translation-specific tables, use the translation table
-        # For bible_books, we need to select the appropriate txt column
-        
-        if table == 'bible_books':
-            # Main table has multiple txt columns
-            txt_column_map = {
-                'cuvs': 'txt_cn',
-                'cuvt': 'txt_tw',
-                'kjv': 'txt_en',   # KJV in main table uses txt_en
-                'pinyin': 'txt_py'
-            }
-            txt_column = txt_column_map.get(trans_lower, 'txt_cn')
-            query = f"""
-                SELECT book, chapter, verse, {txt_column} as txt, likes
-                FROM {table}
-                WHERE book = %s
-                AND chapter = %s
-                AND verse >= %s
-                AND verse <= %s
-                ORDER BY verse
-            """
+    verse_max = min(verse_end + context, max_verse)
+    
+    trans_codes = [t.lower() for t in translations]
+    main_columns = tuple(sorted({
+        MAIN_TABLE_COLUMNS[t] for t in trans_codes if t in MAIN_TABLE_COLUMNS
+    }))
+    separate_codes = list(dict.fromkeys(
+        t for t in trans_codes if t in _SELECT_QUERIES
+    ))
+    
+    async def _fetch_main():
+        if not main_columns:
+            return ()
+        query = _main_table_query(main_columns)
+        return await _load_verses(query, book_id, chapter, verse_min, verse_max)
+    
+    # Each query runs on its own pooled connection
+    main_rows, *separate_rows = await asyncio.gather(
+        _fetch_main(),
+        *[
+            _load_verses(_SELECT_QUERIES[t], book_id, chapter, verse_min, verse_max)
+            for t in separate_codes
+        ]
+    )
+    rows_by_trans = dict(zip(separate_codes, separate_rows))
+    
+    # Pair each output row with its translation and text position
+    entries = []
+    for trans, trans_lower in zip(translations, trans_codes):
+        if trans_lower in MAIN_TABLE_COLUMNS:
+            txt_index = TEXT_COLUMN_OFFSET + main_columns.index(MAIN_TABLE_COLUMNS[trans_lower])
+            entries.extend((trans, row, txt_index) for row in main_rows)
         else:
-            # Translation-specific table
-            query = f"""
-                SELECT Book as book, Chapter as chapter, Verse as verse, Scripture as txt
-                FROM {table}
-                WHERE Book = %s
-                AND Chapter = %s
-                AND Verse >= %s
-                AND Verse <= %s
-                ORDER BY Verse
-            """
-        
-        rows = await db.fetch_all(query, book_id, chapter, verse_min, verse_max)
-        
-        for row in rows:
-            book_short = get_book_short(row['book'])
-            reference = f"{book_short} {row['chapter']}:{row['verse']}"
-            
-            # Process text
-            text = process_bible_text(
-                text=row.get('txt', ''),
-                queries=None,  # No highlighting for reference searches
-                strongs=strongs
+            # Unknown codes have no rows
+            entries.extend(
+                (trans, row, TEXT_COLUMN_OFFSET)
+                for row in rows_by_trans.get(trans_lower, ())
             )
-            
-            results.append(VerseResult(
-                reference=reference,
-                text=text,
-                book=row['book'],
-                chapter=row['chapter'],
-                verse=row['verse'],
-                translation=trans,
-                likes=row.get('likes', 0)
-            ))
+    
+    # Process text (no highlighting for reference searches)
+    texts = await _process_texts(
+        [row[txt_index] or '' for _, row, txt_index in entries],
+        queries=None,
+        strongs=strongs
+    )
+    
+    # Every row is from the requested book and chapter, so only the verse
+    # number varies in the reference. Rows come from the database with the
+    # model's types already, so results skip pydantic validation. Likes are
+    # left at 0 here and filled in per request by fetch_likes
+    reference_prefix = f"{get_book_short(book_id)} {chapter}:"
+    
+    for (trans, row, _), text in zip(entries, texts):
+        verse = row[2]
+        
+        results.append(VerseResult.model_construct(
+            reference=reference_prefix + str(verse),
+            text=text,
+            book=book_id,
+            chapter=chapter,
+            verse=verse,
+            translation=trans,
+            likes=0
+        ))
     
     return results
 
@@ -266,54 +594,59 @@ async def search_by_keywords(
         return results
     
     # Use bible_search table for keyword search
-    # Build WHERE clause for keyword matching
-    conditions = []
-    params = []
-    
+    # Keywords long enough for the FULLTEXT index go into one MATCH
+    # expression; shorter ones (e.g. single CJK characters) fall back to LIKE
+    match_keywords = []
+    like_keywords = []
     for keyword in keywords:
-        conditions.append("txt LIKE %s")
-        params.append(f"%{keyword}%")
+        if settings.fulltext_search and len(keyword) >= settings.fulltext_min_token_size:
+            match_keywords.append(keyword)
+        else:
+            like_keywords.append(keyword)
     
-    where_clause = " AND ".join(conditions)
+    # Rarest keyword first so the AND chain fails as early as possible;
+    # unknown keywords are assumed common and go last (stable among themselves)
+    like_keywords.sort(key=lambda keyword: _keyword_freq.get(keyword, UNRANKED_KEYWORD_FREQ))
     
-    # Add book filter if specified
-    if book_filter:
-        where_clause = f"book = %s AND {where_clause}"
-        params.insert(0, book_filter)
+    # Parameters follow the placeholder order of _keyword_query
+    params = []
+    if match_keywords:
+        # Every keyword is required; quoting makes each one a phrase so
+        # boolean-mode operators inside keywords are not interpreted
+        match_expr = " ".join(
+            '+"{}"'.format(keyword.replace('"', '')) for keyword in match_keywords
+        )
+        params.append(match_expr)
+    book = book_filter or None
+    params.extend((book, book))
+    if match_keywords:
+        params.append(match_expr)
+    params.extend(f"%{keyword}%" for keyword in like_keywords)
     
-    # Build query with parameterized conditions
-    # Note: bible_search doesn't have likes column, so we'll join with bible_books if needed
-    query = f"""
-        SELECT DISTINCT s.book, s.chapter, s.verse, s.txt, COALESCE(b.likes, 0) as likes
-        FROM bible_search s
-        LEFT JOIN bible_books b ON s.book = b.book AND s.chapter = b.chapter AND s.verse = b.verse
-        WHERE {where_clause}
-        ORDER BY s.book, s.chapter, s.verse
-        LIMIT 100
-    """
+    query = _keyword_query(bool(match_keywords), len(like_keywords))
+    rows = await db.fetch_all_tuples(query, *params)
     
-    rows = await db.fetch_all(query, *params)
+    # Process text with keyword highlighting
+    texts = await _process_texts(
+        [row[3] for row in rows],
+        queries=keywords,
+        strongs=strongs
+    )
     
-    for row in rows:
-        book_short = get_book_short(row['book'])
-        reference = f"{book_short} {row['chapter']}:{row['verse']}"
-        
-        # Process text with keyword highlighting
-        text = process_bible_text(
-            text=row['txt'],
-            queries=keywords,
-            strongs=strongs
-        )
+    for row, text in zip(rows, texts):
+        book, chapter, verse = row[0], row[1], row[2]
+        book_short = BOOK_SHORT[book]
+        reference = f"{book_short} {chapter}:{verse}"
         
-        results.append(VerseResult(
+        # Trusted database values; skip pydantic validation
+        results.append(VerseResult.model_construct(
             reference=reference,
             text=text,
-            book=row['book'],
-            chapter=row['chapter'],
-            verse=row['verse'],
+            book=book,
+            chapter=chapter,
+            verse=verse,
             translation=None,  # Search table doesn't specify translation
-            likes=row.get('likes', 0)
+            likes=0  # Filled in per request by fetch_likes
         ))
     
     return results
-
@@ -1,7 +1,8 @@
 """Bible book name utilities and lookup functions."""
+from typing import Dict, Tuple
 
-# Book name arrays
-BOOK_SHORT = [
+# Book name tables, indexed by book ID (index 0 is a placeholder)
+BOOK_SHORT = (
     "", "Gen", "Exod", "Lev", "Num", "Deut", "Josh", "Judg", "Ruth", "1Sam",
     "2Sam", "1Kgs", "2Kgs", "1Chr", "2Chr", "Ezra", "Neh", "Esth", "Job",
     "Ps", "Prov", "Eccl", "Song", "Isa", "Jer", "Lam", "Ezek", "Dan", "Hos",
@@ -10,9 +11,9 @@ BOOK_SHORT = [
     "2Cor", "Gal", "Eph", "Phil", "Col", "1Thess", "2Thess", "1Tim", "2Tim",
     "Titus", "Phlm", "Heb", "Jas", "1Pet", "2Pet", "1John", "2John", "3John",
     "Jude", "Rev"
-]
+)
 
-BOOK_ENGLISH = [
+BOOK_ENGLISH = (
     "", "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy", "Joshua",
     "Judges", "Ruth", "1 Samuel", "2 Samuel", "1 Kings", "2 Kings",
     "1 Chronicles", "2 Chronicles", "Ezra", "Nehemiah", "Esther", "Job",
@@ -24,9 +25,9 @@ BOOK_ENGLISH = [
     "Philippians", "Colossians", "1 Thessalonians", "2 Thessalonians",
     "1 Timothy", "2 Timothy", "Titus", "Philemon", "Hebrews", "James",
     "1 Peter", "2 Peter", "1 John", "2 John", "3 John", "Jude", "Revelation"
-]
+)
 
-BOOK_CHINESE = [
+BOOK_CHINESE = (
     "", "创世记", "出埃及记", "利未记", "民数记", "申命记", "约书亚记",
     "士师记", "路得记", "撒母耳记上", "撒母耳记下", "列王纪上", "列王纪下",
     "历代志上", "历代志下", "以斯拉记", "尼希米记", "以斯帖记", "约伯记",
@@ -38,14 +39,17 @@ BOOK_CHINESE = [
     "腓立比书", "歌罗西书", "帖撒罗尼迦前书", "帖撒罗尼迦后书", "提摩太前书",
     "提摩太后书", "提多书", "腓利门书", "希伯来书", "雅各书", "彼得前书",
     "彼得后书", "约翰一书", "约翰二书", "约翰三书", "犹大书", "启示录"
-]
+)
 
-BOOK_COUNT = [
+BOOK_COUNT = (
     0, 50, 40, 27, 36, 34, 24, 21, 4, 31, 24, 22, 25, 29, 36, 10, 13, 10, 42,
     150, 31, 12, 8, 66, 52, 5, 48, 12, 14, 3, 9, 1, 4, 7, 3, 3, 3, 2, 14, 4,
     28, 16, 24, 21, 28, 16, 16, 13, 6, 6, 4, 4, 5, 3, 6, 4, 3, 1, 13, 5, 5,
     3, 5, 1, 1, 1, 22
-]
+)
+
+# Last verse number per (book, chapter); filled from bible_books at startup
+VERSE_COUNTS: Dict[Tuple[int, int], int] = {}
 
 # Comprehensive book index for lookup (includes all variations)
 BOOK_INDEX = {
@@ -162,9 +166,13 @@ BOOK_INDEX = {
     "马太福音": 40, "鴻": 34, "鸿": 34
 }
 
+# Case-insensitive view of BOOK_INDEX (no two names differ only by case),
+# so any capitalization resolves with a single lookup
+_BOOK_INDEX_FOLDED = {name.casefold(): book_id for name, book_id in BOOK_INDEX.items()}
+
 
 def get_book_id(book_name: str) -> int:
-    """Get book ID from book name (supports multiple formats).
+    """Get book ID from book name (supports multiple formats, any case).
     
     Args:
         book_name: Book name in any format
@@ -172,8 +180,7 @@ def get_book_id(book_name: str) -> int:
     Returns:
         Book ID (1-66), 0 if not found
     """
-    book_name = book_name.strip()
-    return BOOK_INDEX.get(book_name, 0)
+    return _BOOK_INDEX_FOLDED.get(book_name.strip().casefold(), 0)
 
 
 def get_book_short(book_id: int) -> str:
@@ -185,9 +192,12 @@ def get_book_short(book_id: int) -> str:
     Returns:
         Short name (e.g., "Gen", "创")
     """
-    if 0 <= book_id < len(BOOK_SHORT):
+    if book_id < 0:
+        return ""
+    try:
         return BOOK_SHORT[book_id]
-    return ""
+    except IndexError:
+        return ""
 
 
 def get_book_english(book_id: int) -> str:
@@ -199,9 +209,12 @@ def get_book_english(book_id: int) -> str:
     Returns:
         English name (e.g., "Genesis")
     """
-    if 0 <= book_id < len(BOOK_ENGLISH):
+    if book_id < 0:
+        return ""
+    try:
         return BOOK_ENGLISH[book_id]
-    return ""
+    except IndexError:
+        return ""
 
 
 def get_book_chapter_count(book_id: int) -> int:
@@ -213,7 +226,22 @@ def get_book_chapter_count(book_id: int) -> int:
     Returns:
         Chapter count
     """
-    if 0 <= book_id < len(BOOK_COUNT):
+    if book_id < 0:
+        return 0
+    try:
         return BOOK_COUNT[book_id]
-    return 0
+    except IndexError:
+        return 0
+
 
+def get_max_verse(book_id: int, chapter: int) -> int:
+    """Get the last verse number of a chapter.
+    
+    Args:
+        book_id: Book ID (1-66)
+        chapter: Chapter number
+        
+    Returns:
+        Last verse number, 0 if the chapter doesn't exist
+    """
+    return VERSE_COUNTS.get((book_id, chapter), 0)
@@ -0,0 +1,154 @@
+"""Like counter utilities for the Redis-buffered likes backend."""
+import asyncio
+import logging
+from typing import Dict, Iterable, Optional, Tuple
+from app.config import settings
+from app.database import db
+from app.utils.book_utils import get_max_verse
+
+logger = logging.getLogger(__name__)
+
+LIKE_KEY_PREFIX = "like:"
+
+# Redis hash of persisted like counts by "book:chapter:verse", seeded from
+# MySQL on a verse's first like; flushing a verse drops its field so the
+# next like re-reads the new count. Not matched by LIKE_KEY_PREFIX scans
+LIKE_BASE_KEY = "like_base"
+
+# Current persisted likes; no row means 0
+BASE_LIKES_QUERY = """
+    SELECT likes
+    FROM bible_likes
+    WHERE book = %s AND chapter = %s AND verse = %s
+"""
+
+# Applies buffered deltas; aiomysql batches the rows into one statement
+FLUSH_LIKES_QUERY = """
+    INSERT INTO bible_likes (book, chapter, verse, likes)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE likes = likes + VALUES(likes)
+"""
+
+
+def like_key(book: int, chapter: int, verse: int) -> str:
+    """Get the Redis key buffering likes for a verse.
+    
+    Args:
+        book: Book ID (1-66)
+        chapter: Chapter number
+        verse: Verse number
+        
+    Returns:
+        Redis key (e.g., "like:43:3:16")
+    """
+    return f"{LIKE_KEY_PREFIX}{book}:{chapter}:{verse}"
+
+
+async def buffer_like(book: int, chapter: int, verse: int) -> Optional[int]:
+    """Count a like in Redis and return the verse's total likes.
+    
+    Args:
+        book: Book ID (1-66)
+        chapter: Chapter number
+        verse: Verse number
+        
+    Returns:
+        Persisted likes plus buffered likes, or None if the verse doesn't exist
+    """
+    # Verse existence comes from the chapter sizes loaded at startup
+    if verse > get_max_verse(book, chapter):
+        return None
+    
+    field = f"{book}:{chapter}:{verse}"
+    async with db.redis.pipeline(transaction=False) as pipe:
+        pipe.incr(like_key(book, chapter, verse))
+        pipe.hget(LIKE_BASE_KEY, field)
+        pending, base = await pipe.execute()
+    
+    # MySQL is only read for a verse's first like since its last flush
+    if base is None:
+        row = await db.fetch_one(BASE_LIKES_QUERY, book, chapter, verse)
+        base = row['likes'] if row else 0
+        await db.redis.hsetnx(LIKE_BASE_KEY, field, base)
+    
+    return int(base) + pending
+
+
+async def get_pending_likes(
+    verses: Iterable[Tuple[int, int, int]]
+) -> Dict[Tuple[int, int, int], int]:
+    """Get likes buffered in Redis that are not yet flushed to MySQL.
+    
+    Args:
+        verses: (book, chapter, verse) tuples
+        
+    Returns:
+        Dictionary of (book, chapter, verse) to buffered like count
+    """
+    verses = list(verses)
+    if db.redis is None or not verses:
+        return {}
+    
+    values = await db.redis.mget([like_key(*verse) for verse in verses])
+    return {
+        verse: int(value)
+        for verse, value in zip(verses, values)
+        if value
+    }
+
+
+async def flush_pending_likes() -> int:
+    """Move buffered like counts from Redis into bible_likes.
+    
+    Returns:
+        Number of verses flushed
+    """
+    keys = [
+        key async for key in db.redis.scan_iter(match=f"{LIKE_KEY_PREFIX}*", count=1000)
+    ]
+    if not keys:
+        return 0
+    
+    # GETDEL claims each delta atomically, so workers flushing at the same
+    # time never apply the same delta twice
+    async with db.redis.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.getdel(key)
+        values = await pipe.execute()
+    
+    rows = []
+    for key, value in zip(keys, values):
+        if not value:
+            continue
+        book, chapter, verse = (int(part) for part in key[len(LIKE_KEY_PREFIX):].split(':'))
+        rows.append((book, chapter, verse, int(value)))
+    
+    if not rows:
+        return 0
+    
+    try:
+        await db.executemany(FLUSH_LIKES_QUERY, rows)
+    except Exception:
+        # Put the deltas back so the next flush retries them
+        async with db.redis.pipeline(transaction=False) as pipe:
+            for book, chapter, verse, delta in rows:
+                pipe.incrby(like_key(book, chapter, verse), delta)
+            await pipe.execute()
+        raise
+    
+    # Persisted counts changed; the next like of each verse re-reads them
+    await db.redis.hdel(
+        LIKE_BASE_KEY, *(f"{book}:{chapter}:{verse}" for book, chapter, verse, _ in rows)
+    )
+    
+    return len(rows)
+
+
+async def run_likes_flush_loop():
+    """Flush buffered likes every LIKES_FLUSH_INTERVAL seconds until cancelled."""
+    while True:
+        await asyncio.sleep(settings.likes_flush_interval)
+        try:
+            await flush_pending_likes()
+        except Exception:
+            logger.exception("Failed to flush buffered likes")
@@ -1,84 +1,93 @@
 """Query parser for verse references and keywords."""
 import re
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
 from app.utils.book_utils import get_book_id, BOOK_SHORT
 
 
-def parse_verse_reference(query: str) -> Optional[Dict[str, any]]:
+class ParsedQuery(NamedTuple):
+    """Parsed search query; immutable so cached results can be shared."""
+    type: str  # 'reference' or 'keyword'
+    book_id: int = 0
+    chapter: int = 0
+    verse: int = 0
+    verse_end: int = 0
+    keywords: Tuple[str, ...] = ()
+
+
+# Pattern: book name + optional spaces + chapter:verse or chapter:verse-verse2
+# Examples: "John 3:16", "Gen1:1", "约3:16", "1Cor 15:1-5", "1 John 4:8"
+# The book may start with a digit (numbered books); the lazy book group
+# leaves any spaces before the chapter to \s*
+_REF_RE = re.compile(r'^(\d?\s*[^\d:]+?)\s*(\d+):(\d+)(?:-(\d+))?$', re.IGNORECASE)
+
+
+def parse_verse_reference(query: str) -> Optional[ParsedQuery]:
     """Parse a verse reference query (e.g., "John 3:16", "Gen 1:1-3").
     
     Args:
         query: Query string
         
     Returns:
-        Dictionary with book_id, chapter, verse, verse_end, or None if not a reference
+        ParsedQuery with book_id, chapter, verse, verse_end, or None if not a reference
     """
-    query = query.strip()
+    # Every reference has chapter:verse; most keyword queries have no colon
+    if ':' not in query:
+        return None
     
-    # Pattern: book name (with optional spaces) + chapter:verse or chapter:verse-verse2
-    # Examples: "John 3:16", "Gen1:1", "约3:16", "1Cor 15:1-5"
-    patterns = [
-        # Standard format: "Book Chapter:Verse" or "Book Chapter:Verse-Verse2"
-        r'^([^\d\s:]+)\s*(\d+):(\d+)(?:-(\d+))?$',
-        # Format without space: "BookChapter:Verse"
-        r'^([^\d:]+)(\d+):(\d+)(?:-(\d+))?$',
-    ]
+    query = query.strip()
     
-    for pattern in patterns:
-        match = re.match(pattern, query, re.IGNORECASE)
-        if match:
-            book_name = match.group(1).strip()
-            chapter = int(match.group(2))
-            verse = int(match.group(3))
-            verse_end = int(match.group(4)) if match.group(4) else verse
-            
-            # Try to find book ID
-            book_id = get_book_id(book_name)
-            if not book_id:
-                # Try lowercase
-                book_id = get_book_id(book_name.lower())
-            if not book_id:
-                # Try removing common suffixes
-                book_id = get_book_id(book_name.rstrip('.,;'))
-            
-            if book_id:
-                return {
-                    'book_id': book_id,
-                    'chapter': chapter,
-                    'verse': verse,
-                    'verse_end': verse_end,
-                    'type': 'reference'
-                }
+    match = _REF_RE.match(query)
+    if match:
+        book_name = match.group(1).strip()
+        chapter = int(match.group(2))
+        verse = int(match.group(3))
+        verse_end = int(match.group(4)) if match.group(4) else verse
+        
+        # Try to find book ID (lookup is case-insensitive)
+        book_id = get_book_id(book_name)
+        if not book_id:
+            # Try removing common suffixes
+            book_id = get_book_id(book_name.rstrip('.,;'))
+        
+        if book_id:
+            return ParsedQuery(
+                type='reference',
+                book_id=book_id,
+                chapter=chapter,
+                verse=verse,
+                verse_end=verse_end
+            )
     
     return None
 
 
-def parse_keyword_query(query: str) -> Dict[str, any]:
+def parse_keyword_query(query: str) -> ParsedQuery:
     """Parse a keyword search query.
     
     Args:
         query: Query string
         
     Returns:
-        Dictionary with keywords
+        ParsedQuery with keywords
     """
     # Split by spaces and filter empty strings
-    keywords = [q.strip() for q in query.split() if q.strip()]
+    keywords = tuple(q.strip() for q in query.split() if q.strip())
     
-    return {
-        'keywords': keywords,
-        'type': 'keyword'
-    }
+    return ParsedQuery(type='keyword', keywords=keywords)
 
 
-def parse_query(query: str) -> Dict[str, any]:
+@lru_cache(maxsize=4096)
+def parse_query(query: str) -> ParsedQuery:
     """Parse a query (verse reference or keyword).
     
+    Results are cached; popular searches repeat the same query strings.
+    
     Args:
         query: Query string
         
     Returns:
-        Parsed query dictionary
+        Parsed query
     """
     # First try to parse as verse reference
     result = parse_verse_reference(query)
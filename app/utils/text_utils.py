@@ -1,6 +1,60 @@
 """Text processing utilities for Bible text."""
 import re
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# Formatting tag replacements (case-sensitive: uppercase opens, mixed case closes)
+_FORMAT_TAGS = {
+    # Red letter (words of Christ) - <FR>...</Fr>
+    '<FR>': '<span style="color:red;">',
+    '<Fr>': '</span>',
+    # Orange letter (words of angels/divine speech) - <FO>...</Fo>
+    '<FO>': '<span style="color:orange;">',
+    '<Fo>': '</span>',
+    # Italics (supplied words) - <FI>...</Fi>
+    '<FI>': '<i>',
+    '<Fi>': '</i>',
+    # Footnotes/References - <RF>...</Rf>
+    '<RF>': '<span class="footnote">',
+    '<Rf>': '</span>',
+}
+
+# Precompiled patterns; these run once per verse returned
+_RE_FORMAT_TAG = re.compile('|'.join(re.escape(tag) for tag in _FORMAT_TAGS))
+_RE_FONT_COLOR = re.compile(r'<font color=([^>\s"`]+)>', re.IGNORECASE)
+
+# "Directly after a Strong's code tag"; Python lookbehinds must be fixed
+# width, so each tag length gets its own
+_AFTER_STRONGS_TAG = '|'.join(
+    rf'(?<=<{long_form}[GH]\d{{{digits}}}{suffix}>)'
+    for long_form in ('', 'W')
+    for digits in range(1, 5)
+    for suffix in ('', '[a-z]')
+)
+
+# Strong's code after a word: long form <WG123a>/<WH123a>, or short form
+# <G123a>/<H123a> (short form not directly after a tag, unless that tag is
+# itself a Strong's code, as in x<WH1697>爱<H430>), plus any codes that
+# directly follow it (e.g. <WG3056><WH1697>). Groups: word (long), word
+# (short), language letter, number, suffix, following codes
+_RE_STRONGS = re.compile(
+    r'(?:([^\s<>]+)<W|(?:(?<!>)|' + _AFTER_STRONGS_TAG + r')([^\s<>]+)<)'
+    r'([GH])(\d{1,4})([a-z]?)>'
+    r'((?:<W?[GH]\d{1,4}[a-z]?>)*)',
+    re.IGNORECASE
+)
+# One code within a chain of following codes
+_RE_STRONGS_CODE = re.compile(r'<W?([GH])(\d{1,4})([a-z]?)>', re.IGNORECASE)
+
+# fhl.net lexicon: N=0 Greek, N=1 Hebrew
+_STRONGS_LEXICON = {'G': '0', 'H': '1'}
+
+# One pass removes <sup> tags holding only Strong's codes (and whitespace),
+# then any remaining code tag anywhere else
+_RE_REMOVE_STRONGS = re.compile(
+    r'<sup>\s*(?:<[WH]?[GH]\d{1,4}[a-z]?>\s*)+</sup>|<[WH]?[GH]\d{1,4}[a-z]?>',
+    re.IGNORECASE
+)
 
 
 def fix_text_encoding(text: str) -> str:
@@ -32,33 +86,36 @@ def process_formatting_tags(text: str) -> str:
     Returns:
         Processed text
     """
-    # Red letter (words of Christ) - <FR>...</Fr>
-    text = text.replace('<FR>', '<span style="color:red;">')
-    text = text.replace('<Fr>', '</span>')
-    
-    # Orange letter (words of angels/divine speech) - <FO>...</Fo>
-    text = text.replace('<FO>', '<span style="color:orange;">')
-    text = text.replace('<Fo>', '</span>')
-    
-    # Italics (supplied words) - <FI>...</Fi>
-    text = text.replace('<FI>', '<i>')
-    text = text.replace('<Fi>', '</i>')
-    
-    # Footnotes/References - <RF>...</Rf>
-    text = text.replace('<RF>', '<span class="footnote">')
-    text = text.replace('<Rf>', '</span>')
+    # Rewrite all paired formatting tags in a single pass
+    text = _RE_FORMAT_TAG.sub(lambda m: _FORMAT_TAGS[m.group(0)], text)
     
     # Fix font color attributes
-    text = re.sub(
-        r'<font color=([^>\s"`]+)>',
-        r'<font color="\1">',
-        text,
-        flags=re.IGNORECASE
-    )
+    text = _RE_FONT_COLOR.sub(r'<font color="\1">', text)
     
     return text
 
 
+def _strongs_anchor(language: str, number: str, suffix: str) -> str:
+    """Render one Strong's code as a lexicon link in parentheses."""
+    language = language.upper()
+    return (
+        f' (<a href="http://bible.fhl.net/new/s.php?N={_STRONGS_LEXICON[language]}'
+        f'&k={number}" target="_blank">{language}{number}{suffix}</a>)'
+    )
+
+
+def _strongs_link(match: re.Match) -> str:
+    """Render a word and its Strong's codes as the word plus lexicon links."""
+    word = match.group(1) or match.group(2)
+    links = _strongs_anchor(match.group(3), match.group(4), match.group(5))
+    if match.group(6):
+        links += ''.join(
+            _strongs_anchor(*code.groups())
+            for code in _RE_STRONGS_CODE.finditer(match.group(6))
+        )
+    return word + links
+
+
 def process_strongs_codes(text: str) -> str:
     """Process Strong's codes - add as links in parentheses.
     
@@ -68,37 +125,9 @@ def process_strongs_codes(text: str) -> str:
     Returns:
         Processed text
     """
-    # Process <WG...> format (Greek, long form) - supports optional suffix like "a"
-    text = re.sub(
-        r'([^\s<>]+)<WG(\d{1,4})([a-z]?)>',
-        r'\1 (<a href="http://bible.fhl.net/new/s.php?N=0&k=\2" target="_blank">G\2\3</a>)',
-        text,
-        flags=re.IGNORECASE
-    )
-    
-    # Process <WH...> format (Hebrew, long form) - supports optional suffix like "a"
-    text = re.sub(
-        r'([^\s<>]+)<WH(\d{1,4})([a-z]?)>',
-        r'\1 (<a href="http://bible.fhl.net/new/s.php?N=1&k=\2" target="_blank">H\2\3</a>)',
-        text,
-        flags=re.IGNORECASE
-    )
-    
-    # Process <G...> format (Greek, short form) - supports optional suffix like "a"
-    text = re.sub(
-        r'(?<!>)([^\s<>]+)<G(\d{1,4})([a-z]?)>',
-        r'\1 (<a href="http://bible.fhl.net/new/s.php?N=0&k=\2" target="_blank">G\2\3</a>)',
-        text,
-        flags=re.IGNORECASE
-    )
-    
-    # Process <H...> format (Hebrew, short form) - supports optional suffix like "a"
-    text = re.sub(
-        r'(?<!>)([^\s<>]+)<H(\d{1,4})([a-z]?)>',
-        r'\1 (<a href="http://bible.fhl.net/new/s.php?N=1&k=\2" target="_blank">H\2\3</a>)',
-        text,
-        flags=re.IGNORECASE
-    )
+    # All four forms in one pass - supports optional suffix like "a";
+    # consecutive codes after a word are each linked
+    text = _RE_STRONGS.sub(_strongs_link, text)
     
     return text
 
@@ -112,33 +141,27 @@ def remove_strongs_codes(text: str) -> str:
     Returns:
         Processed text
     """
-    # Remove Strong's codes from within <sup> tags, then remove empty <sup> tags
-    text = re.sub(
-        r'<sup>([^<]*)<[WH]?[GH]\d{1,4}[a-z]?>(.*?)</sup>',
-        r'<sup>\1\2</sup>',
-        text,
-        flags=re.IGNORECASE
-    )
-    
-    # Remove <sup> tags that only contain Strong's codes (with optional whitespace)
-    text = re.sub(
-        r'<sup>\s*<[WH]?[GH]\d{1,4}[a-z]?>\s*</sup>',
-        '',
-        text,
-        flags=re.IGNORECASE
-    )
-    
-    # Remove standalone Strong's code tags (not in sup tags)
-    text = re.sub(
-        r'<[WH]?[GH]\d{1,4}[a-z]?>',
-        '',
-        text,
-        flags=re.IGNORECASE
-    )
+    # Single scan: code-only <sup> tags go entirely, other codes are dropped
+    # in place (surrounding <sup> text is kept)
+    text = _RE_REMOVE_STRONGS.sub('', text)
     
     return text
 
 
+@lru_cache(maxsize=1024)
+def _highlight_pattern(queries: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile one case-insensitive alternation for a set of search terms.
+    
+    Longer terms come first so they win over their own substrings, and the
+    lookahead skips text inside HTML tags so attributes are never rewritten.
+    """
+    terms = sorted({q for q in queries if q}, key=len, reverse=True)
+    if not terms:
+        return None
+    alternation = '|'.join(re.escape(term) for term in terms)
+    return re.compile(f'(?:{alternation})(?![^<]*>)', re.IGNORECASE)
+
+
 def highlight_search_terms(text: str, queries: List[str]) -> str:
     """Highlight search terms in text.
     
@@ -149,10 +172,10 @@ def highlight_search_terms(text: str, queries: List[str]) -> str:
     Returns:
         Text with highlighted terms
     """
-    for query_word in queries:
-        if query_word:
-            text = text.replace(query_word, f"<strong>{query_word}</strong>")
-    return text
+    pattern = _highlight_pattern(tuple(queries))
+    if pattern is None:
+        return text
+    return pattern.sub(r'<strong>\g<0></strong>', text)
 
 
 def process_bible_text(
@@ -160,7 +183,11 @@ def process_bible_text(
     queries: Optional[List[str]] = None,
     strongs: bool = False
 ) -> str:
-    """Process Bible text: encoding, formatting, Strong's codes, highlighting.
+    """Process Bible text: formatting, Strong's codes, highlighting.
+    
+    Stored text is already free of replacement characters (see
+    migrations/004_strip_replacement_chars.sql), so fix_text_encoding is
+    not applied here.
     
     Args:
         text: Original text
@@ -170,9 +197,6 @@ def process_bible_text(
     Returns:
         Processed text
     """
-    # Fix encoding
-    text = fix_text_encoding(text)
-    
     # Process formatting tags (always)
     text = process_formatting_tags(text)
     
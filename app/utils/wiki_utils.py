@@ -1,8 +1,162 @@
 """Wiki search and retrieval utilities."""
+import asyncio
+from itertools import islice
 import httpx
-from typing import Optional
+from async_lru import alru_cache
+import orjson
+from typing import Dict, Optional, Set, Tuple
 from app.config import settings
 
+# Maximum UTF-8 bytes per page of wiki content
+WIKI_PAGE_BYTES = 1800
+
+WIKI_API_URL = f"{settings.wiki_base_url.rstrip('/')}/api.php"
+
+# Fixed query parameters; httpx URL-encodes them together with the
+# per-request title or search term
+_CONTENT_PARAMS = {
+    'action': 'query',
+    'prop': 'revisions',
+    'rvprop': 'content',
+    'rvslots': 'main',
+    'format': 'json',
+    'formatversion': 2,
+    'redirects': 1,
+}
+_SEARCH_PARAMS = {
+    'action': 'query',
+    'list': 'search',
+    'format': 'json',
+    'formatversion': 2,
+    'srlimit': 'max',
+}
+
+# Title lookups arriving within this many seconds share one request
+WIKI_BATCH_WINDOW = 0.01
+
+# MediaWiki's limit on titles= values per request for regular clients
+WIKI_BATCH_MAX_TITLES = 50
+
+# Shared HTTP/2 client for MediaWiki calls; opened and closed by the app
+# lifespan so connections (and TLS sessions) are reused across requests
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def open_http_client():
+    """Create the shared MediaWiki HTTP client."""
+    global _http_client
+    _http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    )
+
+
+async def close_http_client():
+    """Close the shared MediaWiki HTTP client."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# Titles waiting for the next batched lookup, and the event that wakes the
+# batch loop; the event is None while the loop is not running
+_pending_titles: Dict[str, asyncio.Future] = {}
+_pending_event: Optional[asyncio.Event] = None
+_batch_tasks: Set[asyncio.Task] = set()
+
+
+async def run_wiki_batch_loop():
+    """Coalesce concurrent title lookups into multi-title MediaWiki queries.
+    
+    Runs until cancelled (started and stopped by the app lifespan). Each
+    wake-up waits WIKI_BATCH_WINDOW for more titles, then sends them in
+    groups of up to WIKI_BATCH_MAX_TITLES as titles=A|B|C.
+    """
+    global _pending_event
+    _pending_event = asyncio.Event()
+    try:
+        while True:
+            await _pending_event.wait()
+            await asyncio.sleep(WIKI_BATCH_WINDOW)
+            _pending_event.clear()
+            while _pending_titles:
+                titles = list(islice(_pending_titles, WIKI_BATCH_MAX_TITLES))
+                futures = {title: _pending_titles.pop(title) for title in titles}
+                task = asyncio.create_task(_resolve_batch(futures))
+                _batch_tasks.add(task)
+                task.add_done_callback(_batch_tasks.discard)
+    finally:
+        _pending_event = None
+        for future in _pending_titles.values():
+            future.cancel()
+        _pending_titles.clear()
+
+
+async def _resolve_batch(futures: Dict[str, asyncio.Future]):
+    """Fetch one batch of titles and hand each waiter its own content."""
+    try:
+        contents = await _fetch_contents(tuple(futures))
+    except Exception as e:
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(e)
+        return
+    for title, future in futures.items():
+        if not future.done():
+            future.set_result(contents[title])
+
+
+async def _lookup_content(title: str) -> str:
+    """Get the content of one wiki page, batched with concurrent lookups."""
+    # '|' separates titles, so such a query cannot share a request
+    if _pending_event is None or '|' in title:
+        return (await _fetch_contents((title,)))[title]
+    future = _pending_titles.get(title)
+    if future is None:
+        future = asyncio.get_running_loop().create_future()
+        _pending_titles[title] = future
+        _pending_event.set()
+    return await asyncio.shield(future)
+
+
+async def _fetch_contents(titles: Tuple[str, ...]) -> Dict[str, str]:
+    """Fetch page content for one or more titles in a single request.
+    
+    Returns:
+        Content per requested title ('' when the page does not exist)
+    """
+    response = await _http_client.get(
+        WIKI_API_URL, params={**_CONTENT_PARAMS, 'titles': '|'.join(titles)}
+    )
+    response.raise_for_status()
+    
+    # formatversion=2 returns pages and revisions as lists
+    data = orjson.loads(response.content)
+    query = data.get('query', {})
+    normalized = {n['from']: n['to'] for n in query.get('normalized', [])}
+    redirects = {r['from']: r['to'] for r in query.get('redirects', [])}
+    
+    by_page = {}
+    for page in query.get('pages', []):
+        revisions = page.get('revisions') or [{}]
+        rev = revisions[0]
+        # Text content sits under slots on MediaWiki 1.32+
+        by_page[page.get('title')] = rev.get('slots', {}).get('main', rev).get('content') or ''
+    
+    contents = {}
+    for title in titles:
+        name = normalized.get(title, title)
+        contents[title] = by_page.get(redirects.get(name, name), '')
+    
+    # Content too large for one response is continued; fetch those alone
+    if 'continue' in data and len(titles) > 1:
+        for title in [t for t in titles if not contents[t]]:
+            contents.update(await _fetch_contents((title,)))
+    
+    return contents
+
 
 async def search_wiki(query: str, page: int = 1) -> str:
     """Search wiki for content.
@@ -14,61 +168,71 @@ async def search_wiki(query: str, page: int = 1) -> str:
     Returns:
         Wiki content or error message
     """
-    page = max(1, page)
-    block_size = 1800
-    wiki_api_base = f"{settings.wiki_base_url.rstrip('/')}/api.php"
-    
-    # First, try to get the page content
-    url = f"{wiki_api_base}?action=query&prop=revisions&rvprop=content|size&format=xml&redirects&titles={query}"
-    
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            
-            # Parse XML response (simplified - in production, use proper XML parser)
-            import xml.etree.ElementTree as ET
-            root = ET.fromstring(response.text)
-            
-            # Extract content size
-            size_elem = root.find('.//rev')
-            size = int(size_elem.get('size', 0)) if size_elem is not None else 0
-            
-            # Extract text content
-            txt = size_elem.text if size_elem is not None and size_elem.text else ''
-            
-            page_count = (size + block_size - 1) // block_size if size > 0 else 1
-            page = min(page, page_count)
-            
-            # If content is too long, paginate
-            if len(txt) > block_size:
-                start = (page - 1) * block_size
-                # Simple byte-based slicing (for UTF-8, this is approximate)
-                txt = txt[start:start + block_size] + f"\n\n(第{page}/{page_count}页)"
-            
-            # If no content found, try search
-            if not txt:
-                search_url = f"{wiki_api_base}?action=query&list=search&format=xml&srlimit=max&srsearch={query}"
-                search_response = await client.get(search_url)
-                search_response.raise_for_status()
-                
-                search_root = ET.fromstring(search_response.text)
-                search_results = search_root.findall('.//p')
-                
-                if search_results:
-                    count = len(search_results)
-                    txt = f"{query} 共搜索到{count} 个词条，请发送完整的词条标题查看内容：\n"
-                    for result in search_results:
-                        title = result.get('title', '')
-                        txt += f"\n {title}\n"
-                    
-                    if len(txt) > 2000:
-                        txt = txt[:2000] + "\n\n内容太长有删节"
-                else:
-                    txt = "没有查到搜索的词条，请更换关键词再搜索。"
-            
-            return txt
-            
+        pages = await _fetch_wiki(query)
     except Exception as e:
         return f"Error fetching wiki content: {str(e)}"
+    
+    if len(pages) == 1:
+        return pages[0]
+    
+    page = min(max(1, page), len(pages))
+    return pages[page - 1] + f"\n\n(第{page}/{len(pages)}页)"
+
 
+def _split_utf8(txt: str, block_size: int) -> Tuple[str, ...]:
+    """Split text into pages of at most block_size UTF-8 bytes.
+    
+    Page ends are moved back to a character boundary, so multi-byte
+    (e.g. Chinese) characters are never cut in half.
+    """
+    data = txt.encode('utf-8')
+    pages = []
+    start = 0
+    while start < len(data):
+        end = min(start + block_size, len(data))
+        # Continuation bytes look like 10xxxxxx
+        while end < len(data) and data[end] & 0xC0 == 0x80:
+            end -= 1
+        pages.append(data[start:end].decode('utf-8'))
+        start = end
+    return tuple(pages)
+
+
+@alru_cache(maxsize=1024, ttl=settings.wiki_cache_ttl)
+async def _fetch_wiki(query: str) -> Tuple[str, ...]:
+    """Fetch wiki content from MediaWiki, split into pages.
+    
+    Cached for WIKI_CACHE_TTL seconds, so paging through an article fetches
+    and splits it once. Concurrent calls for the same query share one fetch.
+    Errors are raised rather than returned, so they are never cached.
+    """
+    # First, try to get the page content
+    txt = await _lookup_content(query)
+    
+    # Split content into pages (a single page when short)
+    if txt:
+        return _split_utf8(txt, WIKI_PAGE_BYTES)
+    
+    # If no content found, try search
+    search_response = await _http_client.get(
+        WIKI_API_URL, params={**_SEARCH_PARAMS, 'srsearch': query}
+    )
+    search_response.raise_for_status()
+    
+    search_data = orjson.loads(search_response.content)
+    search_results = search_data.get('query', {}).get('search', [])
+    
+    if search_results:
+        count = len(search_results)
+        txt = f"{query} 共搜索到{count} 个词条，请发送完整的词条标题查看内容：\n"
+        for result in search_results:
+            title = result.get('title', '')
+            txt += f"\n {title}\n"
+        
+        if len(txt) > 2000:
+            txt = txt[:2000] + "\n\n内容太长有删节"
+    else:
+        txt = "没有查到搜索的词条，请更换关键词再搜索。"
+    
+    return (txt,)
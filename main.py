@@ -1,8 +1,14 @@
 """Main FastAPI application for BibleEngine API."""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from fastapi.responses import ORJSONResponse, Response
+from contextlib import asynccontextmanager, suppress
+import asyncio
+import orjson
+from app.config import settings
 from app.database import db
+from app.utils.like_utils import flush_pending_likes, run_likes_flush_loop
+from app.utils.wiki_utils import open_http_client, close_http_client, run_wiki_batch_loop
 from app.routers import search, wiki, like
 
 # Application lifespan
@@ -11,9 +17,28 @@ async def lifespan(app: FastAPI):
     """Manage application lifespan (startup and shutdown)."""
     # Startup
     await db.connect()
+    await search.load_verse_counts()
+    await search.load_keyword_freq()
+    open_http_client()
+    wiki_batch_task = asyncio.create_task(run_wiki_batch_loop())
+    flush_task = None
+    if db.redis is not None:
+        flush_task = asyncio.create_task(run_likes_flush_loop())
     yield
     # Shutdown
-    await db.disconnect()
+    try:
+        if flush_task is not None:
+            flush_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await flush_task
+            # Persist whatever is still buffered before the pool closes
+            await flush_pending_likes()
+    finally:
+        wiki_batch_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await wiki_batch_task
+        await close_http_client()
+        await db.disconnect()
 
 
 # Create FastAPI app
@@ -22,6 +47,7 @@ app = FastAPI(
     description="Next-generation backend API for Bible verse search, multi-translation access, wiki integration, and user interaction features.",
     version=settings.api_version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # C-accelerated JSON encoding
     docs_url="/docs" if settings.is_development else None,  # Disable docs in production
     redoc_url="/redoc" if settings.is_development else None,  # Disable redoc in production
 )
@@ -55,28 +81,46 @@ app.include_router(
 )
 
 
+# Static endpoint bodies, serialized once. A fresh Response is still built
+# per request because middleware (CORS) mutates response headers in place
+_ROOT_BODY = orjson.dumps({
+    "name": "BibleEngine API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "endpoints": {
+        "search": "/v1/api/search",
+        "wiki": "/v1/api/wiki",
+        "like": "/v1/api/like"
+    }
+})
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "name": "BibleEngine API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "endpoints": {
-            "search": "/v1/api/search",
-            "wiki": "/v1/api/wiki",
-            "like": "/v1/api/like"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop and httptools ship with uvicorn[standard]; multiple workers
+    # need the app as an import string
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=settings.workers or os.cpu_count(),
+        loop="uvloop",
+        http="httptools",
+        proxy_headers=True,
+        access_log=not settings.is_production,
+    )
 
@@ -0,0 +1,19 @@
+-- FULLTEXT index for keyword search on bible_search.txt
+--
+-- Used by search_by_keywords when FULLTEXT_SEARCH=true. Keyword matching
+-- becomes an inverted-index lookup (MATCH ... AGAINST) instead of a full
+-- table scan for every LIKE '%keyword%' predicate.
+--
+-- The ngram parser is required to tokenize Chinese text; it is available in
+-- MySQL 5.7.6+ but not in MariaDB. Keywords shorter than ngram_token_size
+-- (default 2) are still matched with LIKE, which scans the table. Single
+-- Chinese characters are common search terms; to serve them from the index
+-- too, start mysqld with ngram_token_size=1 before creating the index and
+-- set FULLTEXT_MIN_TOKEN_SIZE=1.
+--
+-- If bible_search already has a FULLTEXT index on txt built with the default
+-- parser, drop it first:
+--   SHOW INDEX FROM bible_search WHERE Index_type = 'FULLTEXT';
+--   ALTER TABLE bible_search DROP INDEX <index_name>;
+
+ALTER TABLE bible_search ADD FULLTEXT INDEX ft_txt (txt) WITH PARSER ngram;
@@ -0,0 +1,23 @@
+-- Narrow likes counter table
+--
+-- Likes used to be a column of bible_books, so every like rewrote a page
+-- full of verse text. bible_likes keeps only the key and the counter;
+-- like_verse upserts into it, and the search endpoints read it after the
+-- verse query with one keyed (book, chapter, verse) IN (...) lookup.
+--
+-- Rows exist only for verses that have been liked at least once.
+
+CREATE TABLE IF NOT EXISTS bible_likes (
+    book    INT(11)  NOT NULL,
+    chapter INT(11)  NOT NULL,
+    verse   INT(11)  NOT NULL,
+    likes   INT(11)  NOT NULL DEFAULT 0,
+    PRIMARY KEY (book, chapter, verse)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- Carry over existing counts from bible_books
+INSERT INTO bible_likes (book, chapter, verse, likes)
+SELECT book, chapter, verse, likes
+FROM bible_books
+WHERE likes > 0
+ON DUPLICATE KEY UPDATE likes = VALUES(likes);
@@ -0,0 +1,21 @@
+-- Keyword frequency statistics for keyword search
+--
+-- search_by_keywords loads this table at startup and puts the rarest
+-- LIKE keyword first in the WHERE clause, so AND short-circuits on the
+-- most selective predicate. Keywords missing from the table are assumed
+-- common and go last. The table is optional; an empty or missing table keeps the
+-- keywords in query order.
+--
+-- cnt is the number of bible_search rows containing the keyword.
+
+CREATE TABLE IF NOT EXISTS bible_keyword_freq (
+    kw   VARCHAR(64)  NOT NULL,
+    cnt  INT(11)      NOT NULL,
+    PRIMARY KEY (kw)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_bin;
+
+-- Populate offline for the keywords worth ranking, e.g.:
+--
+-- INSERT INTO bible_keyword_freq (kw, cnt)
+-- SELECT '爱', COUNT(*) FROM bible_search WHERE txt LIKE '%爱%'
+-- ON DUPLICATE KEY UPDATE cnt = VALUES(cnt);
@@ -0,0 +1,40 @@
+-- Strip mis-decoded replacement characters from stored verse text
+--
+-- Some imported text contains 'ï¿½' (the UTF-8 bytes of U+FFFD read as
+-- Latin-1). process_bible_text used to remove it from every verse on every
+-- request; cleaning the data once lets the API skip that pass.
+--
+-- Safe to re-run. Run with a utf8mb4 client connection (mysql
+-- --default-character-set=utf8mb4) so the literal below is sent intact.
+
+UPDATE bible_books SET
+    txt_tw = REPLACE(txt_tw, 'ï¿½', ''),
+    txt_cn = REPLACE(txt_cn, 'ï¿½', ''),
+    txt_en = REPLACE(txt_en, 'ï¿½', ''),
+    txt_py = REPLACE(txt_py, 'ï¿½', '')
+WHERE txt_tw LIKE '%ï¿½%'
+   OR txt_cn LIKE '%ï¿½%'
+   OR txt_en LIKE '%ï¿½%'
+   OR txt_py LIKE '%ï¿½%';
+
+UPDATE bible_search SET txt = REPLACE(txt, 'ï¿½', '') WHERE txt LIKE '%ï¿½%';
+UPDATE bible_multi_search SET txt = REPLACE(txt, 'ï¿½', '') WHERE txt LIKE '%ï¿½%';
+
+-- Translation tables
+UPDATE bible_book_kjv SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_nasb SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_esv SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_cuvc SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_kjv1611 SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_ncvs SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_lcvs SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_ccsb SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_clbs SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_ckjvs SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_ckjvt SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_ukjv SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_tcvs SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_tr SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_wlc SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_bbe SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
+UPDATE bible_book_nstrunv SET Scripture = REPLACE(Scripture, 'ï¿½', '') WHERE Scripture LIKE '%ï¿½%';
@@ -0,0 +1,73 @@
+"""Tests for utils/migrate_to_sqlite.py that need no MySQL server."""
+import importlib.util
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+_SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'utils', 'migrate_to_sqlite.py')
+_spec = importlib.util.spec_from_file_location('migrate_to_sqlite', _SCRIPT)
+migrate_to_sqlite = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(migrate_to_sqlite)
+
+
+class SqliteSourceTest(unittest.TestCase):
+    """--sqlite-source copies from a database this script created."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.source = os.path.join(self.tmp.name, 'snapshot.db')
+        self.target = os.path.join(self.tmp.name, 'bible.db')
+
+        # Built the way the script builds its own output, so it is left in WAL mode
+        conn = migrate_to_sqlite.get_sqlite_connection(self.source)
+        with redirect_stdout(io.StringIO()):
+            migrate_to_sqlite.create_schemas(conn)
+        conn.executemany(
+            'INSERT INTO bible_search (book, chapter, verse, txt) VALUES (?, ?, ?, ?)',
+            [(43, 3, verse, 'love') for verse in range(1, 37)]
+        )
+        conn.execute('INSERT INTO bible_likes (book, chapter, verse, likes) VALUES (43, 3, 16, 7)')
+        conn.close()
+
+    def run_main(self, *args):
+        argv = ['migrate_to_sqlite.py', *args]
+        with mock.patch('sys.argv', argv), redirect_stdout(io.StringIO()):
+            migrate_to_sqlite.main()
+
+    def test_copies_from_wal_snapshot(self):
+        conn = sqlite3.connect(self.source)
+        self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        conn.close()
+
+        self.run_main('--sqlite-source', self.source, '--sqlite-path', self.target)
+
+        conn = sqlite3.connect(self.target)
+        try:
+            self.assertEqual(conn.execute('SELECT COUNT(*) FROM bible_search').fetchone()[0], 36)
+            self.assertEqual(
+                conn.execute(
+                    "SELECT COUNT(*) FROM bible_search_fts WHERE bible_search_fts MATCH 'love'"
+                ).fetchone()[0],
+                36
+            )
+            self.assertEqual(
+                conn.execute('SELECT likes FROM bible_likes WHERE verse = 16').fetchone()[0], 7
+            )
+        finally:
+            conn.close()
+
+    def test_missing_source_exits(self):
+        missing = os.path.join(self.tmp.name, 'typo.db')
+        with self.assertRaises(SystemExit) as cm:
+            self.run_main('--sqlite-source', missing, '--sqlite-path', self.target)
+        self.assertEqual(cm.exception.code, 1)
+        self.assertFalse(os.path.exists(missing))
+
+
+if __name__ == '__main__':
+    unittest.main()
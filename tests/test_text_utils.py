@@ -0,0 +1,37 @@
+"""Tests for app/utils/text_utils.py."""
+import unittest
+
+from app.utils.text_utils import process_strongs_codes
+
+
+class StrongsCodesTest(unittest.TestCase):
+    """process_strongs_codes links every Strong's code and leaves other tags alone."""
+
+    def assertLinked(self, text, *numbers):
+        html = process_strongs_codes(text)
+        for number in numbers:
+            self.assertIn(f'&k={number}"', html)
+        self.assertNotRegex(html, r'<W?[GH]\d+[a-z]?>')
+        return html
+
+    def test_short_form_after_long_form(self):
+        html = self.assertLinked('x<WH1697>爱<H430>', 1697, 430)
+        self.assertTrue(html.startswith('x ('))
+        self.assertIn('爱 (', html)
+
+    def test_short_form_after_short_form(self):
+        self.assertLinked('x<G1>爱<H430>', 1, 430)
+
+    def test_chained_codes(self):
+        html = self.assertLinked('λόγος<WG3056><WH1697>', 3056, 1697)
+        self.assertTrue(html.startswith('λόγος ('))
+
+    def test_separate_words(self):
+        self.assertLinked('Jesus<G2424> wept<G1145>', 2424, 1145)
+
+    def test_short_form_after_other_tag(self):
+        self.assertEqual(process_strongs_codes('<sup><G123></sup>text'), '<sup><G123></sup>text')
+
+
+if __name__ == '__main__':
+    unittest.main()
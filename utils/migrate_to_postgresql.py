@@ -15,9 +15,23 @@ Usage:
 """
 
 import argparse
+import csv
+import io
 import os
 import sys
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Tuple
+
+# Database drivers are imported once here rather than inside every helper
+# and worker; a missing driver is reported by main() so --help still works
+try:
+    import psycopg2
+    import pymysql
+    from psycopg2 import sql
+    from psycopg2.extras import execute_values
+    DRIVER_IMPORT_ERROR = None
+except ImportError as e:
+    DRIVER_IMPORT_ERROR = e
 
 # ============================================================================
 # TRANSLATION TABLES - All bible_book_{translation} tables
@@ -84,12 +98,14 @@ CREATE TABLE IF NOT EXISTS bible_books (
     updated  DATE,
     reported DATE,
     likes    INTEGER      NOT NULL DEFAULT 0,
+    tsv      TSVECTOR     GENERATED ALWAYS AS
+             (to_tsvector('simple', COALESCE(txt_tw, ''))) STORED,
     PRIMARY KEY (book, chapter, verse)
 );
 
--- Create full-text search index using tsvector
-CREATE INDEX IF NOT EXISTS idx_bible_books_txt_tw_fts
-ON bible_books USING gin(to_tsvector('simple', COALESCE(txt_tw, '')));
+-- Tables created by earlier runs predate the tsv column (PostgreSQL 12+)
+ALTER TABLE bible_books ADD COLUMN IF NOT EXISTS
+    tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector('simple', COALESCE(txt_tw, ''))) STORED;
 """
 
 SCHEMA_BIBLE_SEARCH = """
@@ -98,12 +114,12 @@ CREATE TABLE IF NOT EXISTS bible_search (
     chapter SMALLINT     NOT NULL,
     verse   SMALLINT     NOT NULL,
     txt     TEXT         NOT NULL,
+    tsv     TSVECTOR     GENERATED ALWAYS AS (to_tsvector('simple', txt)) STORED,
     PRIMARY KEY (book, chapter, verse)
 );
 
--- Create full-text search index
-CREATE INDEX IF NOT EXISTS idx_bible_search_txt_fts
-ON bible_search USING gin(to_tsvector('simple', txt));
+ALTER TABLE bible_search ADD COLUMN IF NOT EXISTS
+    tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector('simple', txt)) STORED;
 """
 
 SCHEMA_BIBLE_MULTI_SEARCH = """
@@ -112,14 +128,43 @@ CREATE TABLE IF NOT EXISTS bible_multi_search (
     chapter SMALLINT     NOT NULL,
     verse   SMALLINT     NOT NULL,
     txt     TEXT         NOT NULL,
+    tsv     TSVECTOR     GENERATED ALWAYS AS (to_tsvector('simple', txt)) STORED,
     PRIMARY KEY (book, chapter, verse)
 );
 
--- Create full-text search index
-CREATE INDEX IF NOT EXISTS idx_bible_multi_search_txt_fts
-ON bible_multi_search USING gin(to_tsvector('simple', txt));
+ALTER TABLE bible_multi_search ADD COLUMN IF NOT EXISTS
+    tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector('simple', txt)) STORED;
 """
 
+SCHEMA_BIBLE_LIKES = """
+CREATE TABLE IF NOT EXISTS bible_likes (
+    book    INTEGER      NOT NULL,
+    chapter INTEGER      NOT NULL,
+    verse   INTEGER      NOT NULL,
+    likes   INTEGER      NOT NULL DEFAULT 0,
+    PRIMARY KEY (book, chapter, verse)
+);
+"""
+
+# Full-text search indexes, built once after the data is loaded: a single
+# GIN build over a full table is much cheaper than updating it per row.
+# They index the stored tsv columns, computed once per row on write, so
+# queries (WHERE tsv @@ plainto_tsquery('simple', ...)) never re-run to_tsvector
+POST_LOAD_INDEXES = [
+    ('idx_bible_books_txt_tw_fts', """
+CREATE INDEX IF NOT EXISTS idx_bible_books_txt_tw_fts
+ON bible_books USING gin(tsv);
+"""),
+    ('idx_bible_search_txt_fts', """
+CREATE INDEX IF NOT EXISTS idx_bible_search_txt_fts
+ON bible_search USING gin(tsv);
+"""),
+    ('idx_bible_multi_search_txt_fts', """
+CREATE INDEX IF NOT EXISTS idx_bible_multi_search_txt_fts
+ON bible_multi_search USING gin(tsv);
+"""),
+]
+
 # Template for translation tables (Book, Chapter, Verse capitalized as in MySQL)
 SCHEMA_TRANSLATION_TABLE = """
 CREATE TABLE IF NOT EXISTS {table_name} (
@@ -131,6 +176,84 @@ CREATE TABLE IF NOT EXISTS {table_name} (
 );
 """
 
+# ============================================================================
+# INSERT / COPY STATEMENTS
+# ============================================================================
+
+BIBLE_BOOK_COLS = ['id', 'en', 'english', 'english2', 'en1', 'en2', 'en3',
+                   'short', 'chinese', 'cn', 'taiwan', 'tw', 'abbr', 'count', 'offset']
+
+BIBLE_BOOK_INSERT_SQL = """
+    INSERT INTO bible_book (id, en, english, english2, en1, en2, en3,
+                            short, chinese, cn, taiwan, tw, abbr, count, "offset")
+    VALUES %s
+    ON CONFLICT (id) DO UPDATE SET
+        en = EXCLUDED.en, english = EXCLUDED.english, english2 = EXCLUDED.english2,
+        en1 = EXCLUDED.en1, en2 = EXCLUDED.en2, en3 = EXCLUDED.en3,
+        short = EXCLUDED.short, chinese = EXCLUDED.chinese, cn = EXCLUDED.cn,
+        taiwan = EXCLUDED.taiwan, tw = EXCLUDED.tw, abbr = EXCLUDED.abbr,
+        count = EXCLUDED.count, "offset" = EXCLUDED."offset"
+"""
+
+BIBLE_BOOKS_COLS = ['id', 'book', 'chapter', 'verse', 'txt_tw', 'txt_cn',
+                    'txt_en', 'txt_py', 'short', 'updated', 'reported', 'likes']
+
+BIBLE_BOOKS_INSERT_SQL = """
+    INSERT INTO bible_books (id, book, chapter, verse, txt_tw, txt_cn,
+                             txt_en, txt_py, short, updated, reported, likes)
+    VALUES %s
+    ON CONFLICT (book, chapter, verse) DO UPDATE SET
+        id = EXCLUDED.id, txt_tw = EXCLUDED.txt_tw, txt_cn = EXCLUDED.txt_cn,
+        txt_en = EXCLUDED.txt_en, txt_py = EXCLUDED.txt_py, short = EXCLUDED.short,
+        updated = EXCLUDED.updated, reported = EXCLUDED.reported, likes = EXCLUDED.likes
+"""
+
+SEARCH_COLS = ['book', 'chapter', 'verse', 'txt']
+
+# bible_search and bible_multi_search share a layout
+SEARCH_INSERT_SQL = """
+    INSERT INTO {table_name} (book, chapter, verse, txt)
+    VALUES %s
+    ON CONFLICT (book, chapter, verse) DO UPDATE SET txt = EXCLUDED.txt
+"""
+
+# Like counters, split out of bible_books (migrations/002_bible_likes.sql);
+# bible_books.likes is no longer written after that migration
+BIBLE_LIKES_COLS = ['book', 'chapter', 'verse', 'likes']
+
+BIBLE_LIKES_INSERT_SQL = """
+    INSERT INTO bible_likes (book, chapter, verse, likes)
+    VALUES %s
+    ON CONFLICT (book, chapter, verse) DO UPDATE SET likes = EXCLUDED.likes
+"""
+
+# Core tables in migration order: name -> (columns, insert_sql)
+CORE_TABLE_SQL = {
+    'bible_book': (BIBLE_BOOK_COLS, BIBLE_BOOK_INSERT_SQL),
+    'bible_books': (BIBLE_BOOKS_COLS, BIBLE_BOOKS_INSERT_SQL),
+    'bible_likes': (BIBLE_LIKES_COLS, BIBLE_LIKES_INSERT_SQL),
+    'bible_search': (SEARCH_COLS, SEARCH_INSERT_SQL.format(table_name='bible_search')),
+    'bible_multi_search': (
+        SEARCH_COLS, SEARCH_INSERT_SQL.format(table_name='bible_multi_search')
+    ),
+}
+
+TRANSLATION_COLUMNS = ['Book', 'Chapter', 'Verse', 'Scripture']
+
+# Bytes psycopg2 requests per read of a COPY stream
+COPY_READ_SIZE = 64 * 1024
+
+# NULL is spelled \N so empty strings survive the CSV round trip. FREEZE
+# writes rows already frozen, sparing the first VACUUM; it is allowed
+# because the table is truncated in the same transaction
+TRANSLATION_COPY_SQL = {
+    table_name: f"""
+    COPY "{table_name}" ("Book", "Chapter", "Verse", "Scripture")
+    FROM STDIN WITH (FORMAT csv, NULL '\\N', FREEZE)
+"""
+    for table_name in TRANSLATION_TABLES
+}
+
 # ============================================================================
 # ARGUMENT PARSING
 # ============================================================================
@@ -173,7 +296,8 @@ Examples:
 
 Tables Migrated:
   - bible_book        : Book metadata (66 books)
-  - bible_books       : Main verses table with likes
+  - bible_books       : Main verses table
+  - bible_likes       : Like counters
   - bible_search      : Full-text search index
   - bible_multi_search: Multi-language search index
   - bible_book_*      : 20+ translation tables (KJV, CUVS, etc.)
@@ -246,6 +370,12 @@ Tables Migrated:
         default=1000,
         help='Batch size for bulk inserts (default: 1000)'
     )
+    migration_group.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Tables migrated in parallel (default: 8)'
+    )
     migration_group.add_argument(
         '--dry-run',
         action='store_true',
@@ -286,15 +416,17 @@ QUICK START:
 
 FEATURES:
     - Automatic database creation in PostgreSQL
-    - Full-text search using GIN indexes with tsvector
+    - Full-text search using GIN indexes on stored tsvector columns
     - Batch inserts for performance
+    - Tables migrated in parallel, translation tables via COPY
     - Upsert support (ON CONFLICT)
     - Environment variable support for credentials
 
 DATABASE SCHEMA:
     Core Tables:
         bible_book         - Book metadata (id, names in EN/CN/TW)
-        bible_books        - Main verses with likes count
+        bible_books        - Main verses
+        bible_likes        - Like counters
         bible_search       - Full-text search index
         bible_multi_search - Multi-language search
 
@@ -315,36 +447,46 @@ For full options, run: python3 migrate_to_postgresql.py --help
 # HELPER FUNCTIONS
 # ============================================================================
 
-def get_mysql_connection(config: dict):
-    """Create MySQL connection."""
-    import pymysql
+def get_mysql_connection(config: dict, cursorclass=None):
+    """Create MySQL connection.
+
+    Pass ``pymysql.cursors.SSCursor`` as ``cursorclass`` to stream result
+    rows from the server instead of buffering the whole result set.
+    """
     return pymysql.connect(
         host=config['host'],
         port=config['port'],
         user=config['user'],
         password=config['password'],
         database=config['database'],
-        charset='utf8mb4'
+        charset='utf8mb4',
+        cursorclass=cursorclass or pymysql.cursors.Cursor
     )
 
 
 def get_postgres_connection(config: dict):
-    """Create PostgreSQL connection."""
-    import psycopg2
-    return psycopg2.connect(
+    """Create PostgreSQL connection.
+
+    The session skips waiting for WAL flushes on commit: a crash mid-migration
+    only means rerunning the migration.
+    """
+    conn = psycopg2.connect(
         host=config['host'],
         port=config['port'],
         user=config['user'],
         password=config['password'],
         database=config['database']
     )
+    conn.autocommit = False
+    cur = conn.cursor()
+    cur.execute("SET synchronous_commit TO OFF")
+    conn.commit()
+    cur.close()
+    return conn
 
 
 def create_database_if_not_exists(config: dict):
     """Create PostgreSQL database if it doesn't exist."""
-    import psycopg2
-    from psycopg2 import sql
-
     conn_config = config.copy()
     db_name = conn_config.pop('database')
     conn_config['database'] = 'postgres'
@@ -382,15 +524,23 @@ def get_row_count(cur, table_name: str) -> int:
     return cur.fetchone()[0]
 
 
-def fetch_all_data(cur, table_name: str, columns: List[str]) -> List[Tuple]:
-    """Fetch all data from a MySQL table."""
+def iter_rows(cur, table_name: str, columns: List[str],
+              chunk: int = 10_000) -> Iterator[List[Tuple]]:
+    """Yield rows of a MySQL table in chunks of up to ``chunk`` rows.
+
+    With a server-side (SSCursor) cursor only one chunk is held in memory.
+    """
     cols = ', '.join(f'`{c}`' for c in columns)
     cur.execute(f"SELECT {cols} FROM `{table_name}`")
-    return cur.fetchall()
+    while True:
+        rows = cur.fetchmany(chunk)
+        if not rows:
+            break
+        yield rows
 
 
 def migrate_table(
-    mysql_cur,
+    mysql_conn,
     pg_conn,
     table_name: str,
     columns: List[str],
@@ -399,14 +549,23 @@ def migrate_table(
     database: str,
     dry_run: bool = False
 ):
-    """Migrate data from MySQL table to PostgreSQL."""
-    from psycopg2.extras import execute_batch
+    """Migrate data from MySQL table to PostgreSQL.
 
-    if not table_exists_mysql(mysql_cur, database, table_name):
-        print(f"  Table '{table_name}' does not exist in MySQL, skipping...")
-        return
+    ``insert_sql`` is an ``execute_values`` template: a single ``VALUES %s``
+    that is expanded into one multi-row INSERT per ``batch_size`` rows.
+    Rows are streamed with the connection's default (server-side) cursor.
+    """
+    # Metadata queries use a buffered cursor so they can run before the
+    # streaming one
+    meta_cur = mysql_conn.cursor(pymysql.cursors.Cursor)
+    try:
+        if not table_exists_mysql(meta_cur, database, table_name):
+            print(f"  Table '{table_name}' does not exist in MySQL, skipping...")
+            return
 
-    row_count = get_row_count(mysql_cur, table_name)
+        row_count = get_row_count(meta_cur, table_name)
+    finally:
+        meta_cur.close()
     print(f"  Migrating {row_count} rows from '{table_name}'...")
 
     if dry_run:
@@ -417,19 +576,27 @@ def migrate_table(
         print(f"  No data in '{table_name}', skipping...")
         return
 
-    data = fetch_all_data(mysql_cur, table_name, columns)
     pg_cur = pg_conn.cursor()
+    mysql_cur = mysql_conn.cursor()
 
     try:
+        # Empty the table in the same transaction as the load; with
+        # synchronous_commit off the single commit does not wait on WAL
+        # flushes. The table stays logged: SET LOGGED afterwards would
+        # rewrite it and rebuild its indexes
         pg_cur.execute(f'TRUNCATE TABLE "{table_name}" CASCADE')
-        execute_batch(pg_cur, insert_sql, data, page_size=batch_size)
+        migrated = 0
+        for rows in iter_rows(mysql_cur, table_name, columns):
+            execute_values(pg_cur, insert_sql, rows, page_size=batch_size)
+            migrated += len(rows)
         pg_conn.commit()
-        print(f"  Successfully migrated {len(data)} rows to '{table_name}'")
+        print(f"  Successfully migrated {migrated} rows to '{table_name}'")
     except Exception as e:
         pg_conn.rollback()
         print(f"  Error migrating '{table_name}': {e}")
         raise
     finally:
+        mysql_cur.close()
         pg_cur.close()
 
 
@@ -453,6 +620,9 @@ def create_schemas(pg_conn, dry_run: bool = False):
     print("Creating bible_books...")
     cur.execute(SCHEMA_BIBLE_BOOKS)
 
+    print("Creating bible_likes...")
+    cur.execute(SCHEMA_BIBLE_LIKES)
+
     print("Creating bible_search...")
     cur.execute(SCHEMA_BIBLE_SEARCH)
 
@@ -463,91 +633,205 @@ def create_schemas(pg_conn, dry_run: bool = False):
         print(f"Creating {table_name}...")
         cur.execute(SCHEMA_TRANSLATION_TABLE.format(table_name=table_name))
 
+    # Earlier versions of this script loaded tables UNLOGGED; one that was
+    # interrupted can leave them that way, and they would lose their data on
+    # a server crash
+    cur.execute(
+        "SELECT relname FROM pg_class WHERE relkind = 'r' AND relpersistence = 'u' "
+        "AND relname = ANY(%s)",
+        (list(CORE_TABLE_SQL) + TRANSLATION_TABLES,)
+    )
+    for (table_name,) in cur.fetchall():
+        print(f"WARNING: table '{table_name}' is UNLOGGED; "
+              f"run ALTER TABLE \"{table_name}\" SET LOGGED")
+
+    # Drop FTS indexes left by an earlier run so the load does not keep them
+    # up to date row by row; create_post_load_indexes rebuilds them
+    for index_name, _ in POST_LOAD_INDEXES:
+        cur.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
     pg_conn.commit()
     cur.close()
     print("\nAll schemas created successfully.")
 
 
-def migrate_bible_book(mysql_cur, pg_conn, batch_size: int, database: str, dry_run: bool):
-    """Migrate bible_book table."""
-    columns = ['id', 'en', 'english', 'english2', 'en1', 'en2', 'en3',
-               'short', 'chinese', 'cn', 'taiwan', 'tw', 'abbr', 'count', 'offset']
-
-    insert_sql = """
-        INSERT INTO bible_book (id, en, english, english2, en1, en2, en3,
-                                short, chinese, cn, taiwan, tw, abbr, count, "offset")
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (id) DO UPDATE SET
-            en = EXCLUDED.en, english = EXCLUDED.english, english2 = EXCLUDED.english2,
-            en1 = EXCLUDED.en1, en2 = EXCLUDED.en2, en3 = EXCLUDED.en3,
-            short = EXCLUDED.short, chinese = EXCLUDED.chinese, cn = EXCLUDED.cn,
-            taiwan = EXCLUDED.taiwan, tw = EXCLUDED.tw, abbr = EXCLUDED.abbr,
-            count = EXCLUDED.count, "offset" = EXCLUDED."offset"
-    """
-    migrate_table(mysql_cur, pg_conn, 'bible_book', columns, insert_sql,
-                  batch_size, database, dry_run)
-
-
-def migrate_bible_books(mysql_cur, pg_conn, batch_size: int, database: str, dry_run: bool):
-    """Migrate bible_books table."""
-    columns = ['id', 'book', 'chapter', 'verse', 'txt_tw', 'txt_cn',
-               'txt_en', 'txt_py', 'short', 'updated', 'reported', 'likes']
-
-    insert_sql = """
-        INSERT INTO bible_books (id, book, chapter, verse, txt_tw, txt_cn,
-                                 txt_en, txt_py, short, updated, reported, likes)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (book, chapter, verse) DO UPDATE SET
-            id = EXCLUDED.id, txt_tw = EXCLUDED.txt_tw, txt_cn = EXCLUDED.txt_cn,
-            txt_en = EXCLUDED.txt_en, txt_py = EXCLUDED.txt_py, short = EXCLUDED.short,
-            updated = EXCLUDED.updated, reported = EXCLUDED.reported, likes = EXCLUDED.likes
-    """
-    migrate_table(mysql_cur, pg_conn, 'bible_books', columns, insert_sql,
-                  batch_size, database, dry_run)
+def create_post_load_indexes(pg_conn, dry_run: bool = False):
+    """Build the full-text search indexes once all data is loaded."""
+    print("\n=== Building Full-Text Search Indexes ===\n")
 
+    if dry_run:
+        print("[DRY RUN] Would build full-text search indexes")
+        return
 
-def migrate_bible_search(mysql_cur, pg_conn, batch_size: int, database: str, dry_run: bool):
-    """Migrate bible_search table."""
-    columns = ['book', 'chapter', 'verse', 'txt']
-    insert_sql = """
-        INSERT INTO bible_search (book, chapter, verse, txt)
-        VALUES (%s, %s, %s, %s)
-        ON CONFLICT (book, chapter, verse) DO UPDATE SET txt = EXCLUDED.txt
+    cur = pg_conn.cursor()
+    try:
+        cur.execute("SET maintenance_work_mem = '1GB'")
+        for index_name, index_sql in POST_LOAD_INDEXES:
+            print(f"Creating {index_name}...")
+            cur.execute(index_sql)
+        pg_conn.commit()
+    except Exception:
+        pg_conn.rollback()
+        raise
+    finally:
+        cur.close()
+    print("\nAll indexes created successfully.")
+
+
+def load_core_table(mysql_config: dict, pg_config: dict, table_name: str,
+                    batch_size: int, dry_run: bool):
+    """Migrate a core table with its precomputed upsert on its own connections.
+
+    Safe to run in a worker thread.
     """
-    migrate_table(mysql_cur, pg_conn, 'bible_search', columns, insert_sql,
-                  batch_size, database, dry_run)
+    columns, insert_sql = CORE_TABLE_SQL[table_name]
+    mysql_conn = get_mysql_connection(mysql_config, pymysql.cursors.SSCursor)
+    pg_conn = None
+    try:
+        if not dry_run:
+            pg_conn = get_postgres_connection(pg_config)
+        migrate_table(mysql_conn, pg_conn, table_name, columns, insert_sql,
+                      batch_size, mysql_config['database'], dry_run)
+    finally:
+        mysql_conn.close()
+        if pg_conn:
+            pg_conn.close()
 
 
-def migrate_bible_multi_search(mysql_cur, pg_conn, batch_size: int, database: str, dry_run: bool):
-    """Migrate bible_multi_search table."""
-    columns = ['book', 'chapter', 'verse', 'txt']
-    insert_sql = """
-        INSERT INTO bible_multi_search (book, chapter, verse, txt)
-        VALUES (%s, %s, %s, %s)
-        ON CONFLICT (book, chapter, verse) DO UPDATE SET txt = EXCLUDED.txt
+class _CsvRowStream:
+    """Read-only file over row chunks, encoded as CSV for COPY FROM STDIN.
+
+    Chunks are formatted only as COPY asks for more data, so a single COPY
+    streams the whole table while one chunk at a time is held in memory.
     """
-    migrate_table(mysql_cur, pg_conn, 'bible_multi_search', columns, insert_sql,
-                  batch_size, database, dry_run)
-
-
-def migrate_translation_table(mysql_cur, pg_conn, table_name: str, batch_size: int,
-                               database: str, dry_run: bool):
-    """Migrate a translation table."""
-    columns = ['Book', 'Chapter', 'Verse', 'Scripture']
-    insert_sql = f"""
-        INSERT INTO "{table_name}" ("Book", "Chapter", "Verse", "Scripture")
-        VALUES (%s, %s, %s, %s)
-        ON CONFLICT ("Book", "Chapter", "Verse") DO UPDATE SET
-            "Scripture" = EXCLUDED."Scripture"
+
+    def __init__(self, chunks: Iterator[List[Tuple]]):
+        self._chunks = chunks
+        self._buf = io.StringIO()
+        self._writer = csv.writer(self._buf)
+        self._data = ''
+        self._pos = 0
+        self.rows = 0
+
+    def _fill(self) -> bool:
+        rows = next(self._chunks, None)
+        if rows is None:
+            return False
+        self._buf.seek(0)
+        self._buf.truncate()
+        writerow = self._writer.writerow
+        for row in rows:
+            writerow(['\\N' if v is None else v for v in row])
+        self._data = self._buf.getvalue()
+        self._pos = 0
+        self.rows += len(rows)
+        return True
+
+    def read(self, size: int = -1) -> str:
+        # Short reads are fine for COPY; an empty string ends the stream
+        while self._pos >= len(self._data):
+            if not self._fill():
+                return ''
+        end = len(self._data) if size < 0 else self._pos + size
+        data = self._data[self._pos:end]
+        self._pos += len(data)
+        return data
+
+
+def load_table_via_copy(mysql_config: dict, pg_config: dict, table_name: str,
+                        batch_size: int, dry_run: bool):
+    """Migrate a translation table with COPY on its own pair of connections.
+
+    Rows are streamed from MySQL with a server-side cursor in ``batch_size``
+    chunks and piped as CSV into one COPY per table; the target is truncated
+    first, so COPY needs no ON CONFLICT handling or staging table. Safe to
+    run in a worker thread.
     """
-    migrate_table(mysql_cur, pg_conn, table_name, columns, insert_sql,
-                  batch_size, database, dry_run)
+    mysql_conn = get_mysql_connection(mysql_config, pymysql.cursors.SSCursor)
+    pg_conn = None
+    try:
+        # Metadata queries use a buffered cursor so they can run before the
+        # streaming one
+        meta_cur = mysql_conn.cursor(pymysql.cursors.Cursor)
+        if not table_exists_mysql(meta_cur, mysql_config['database'], table_name):
+            print(f"  Table '{table_name}' does not exist in MySQL, skipping...")
+            return
+
+        row_count = get_row_count(meta_cur, table_name)
+        meta_cur.close()
+        if dry_run:
+            print(f"  [DRY RUN] Would migrate {row_count} rows from '{table_name}'")
+            return
+
+        if row_count == 0:
+            print(f"  No data in '{table_name}', skipping...")
+            return
+
+        pg_conn = get_postgres_connection(pg_config)
+        pg_cur = pg_conn.cursor()
+        copy_sql = TRANSLATION_COPY_SQL[table_name]
+        mysql_cur = mysql_conn.cursor()
+
+        try:
+            # TRUNCATE and COPY share one transaction: that is what allows
+            # FREEZE, and under wal_level=minimal it also skips WAL for the
+            # load. Toggling UNLOGGED/LOGGED here would rewrite the table and
+            # lose the freeze
+            pg_cur.execute(f'TRUNCATE TABLE "{table_name}" CASCADE')
+            # USER triggers only: disabling system (FK) triggers needs superuser
+            pg_cur.execute(f'ALTER TABLE "{table_name}" DISABLE TRIGGER USER')
+            stream = _CsvRowStream(
+                iter_rows(mysql_cur, table_name, TRANSLATION_COLUMNS, batch_size)
+            )
+            pg_cur.copy_expert(copy_sql, stream, size=COPY_READ_SIZE)
+            pg_cur.execute(f'ALTER TABLE "{table_name}" ENABLE TRIGGER USER')
+            pg_conn.commit()
+            print(f"  Successfully migrated {stream.rows} rows to '{table_name}'")
+        except Exception as e:
+            pg_conn.rollback()
+            print(f"  Error migrating '{table_name}': {e}")
+            raise
+        finally:
+            mysql_cur.close()
+            pg_cur.close()
+    finally:
+        mysql_conn.close()
+        if pg_conn:
+            pg_conn.close()
+
+
+# Every migratable table with its loader, in migration order. All loaders
+# share one signature and open their own connections, so any subset can be
+# handed to the thread pool
+MIGRATIONS = [
+    *((table_name, load_core_table) for table_name in CORE_TABLE_SQL),
+    *((table_name, load_table_via_copy) for table_name in TRANSLATION_TABLES),
+]
+
+
+def run_migrations(mysql_config: dict, pg_config: dict, migrations: List[Tuple],
+                   batch_size: int, workers: int, dry_run: bool):
+    """Run (table_name, loader) migrations concurrently, one worker per table."""
+    print(f"Migrating {len(migrations)} tables with {workers} workers...")
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [
+            pool.submit(loader, mysql_config, pg_config, table_name,
+                        batch_size, dry_run)
+            for table_name, loader in migrations
+        ]
+        # Re-raise the first failure once every worker has finished
+        for future in futures:
+            future.result()
 
 
 def main():
     """Main migration function."""
     args = parse_args()
 
+    if DRIVER_IMPORT_ERROR:
+        print(f"Error: {DRIVER_IMPORT_ERROR}. Run: pip install pymysql psycopg2-binary")
+        sys.exit(1)
+
     print("=" * 60)
     print("MySQL to PostgreSQL Migration for BibleEngine")
     print("=" * 60)
@@ -582,11 +866,11 @@ def main():
     else:
         print(f"[DRY RUN] Would create database '{pg_config['database']}' if not exists")
 
-    # Step 2: Connect to databases
+    # Step 2: Check connectivity; each table is then migrated on its own
+    # connections
     print("\n=== Step 2: Connecting to Databases ===\n")
     try:
-        mysql_conn = get_mysql_connection(mysql_config)
-        mysql_cur = mysql_conn.cursor()
+        get_mysql_connection(mysql_config).close()
         print(f"Connected to MySQL at {mysql_config['host']}:{mysql_config['port']}")
     except Exception as e:
         print(f"Error connecting to MySQL: {e}")
@@ -599,7 +883,6 @@ def main():
             print(f"Connected to PostgreSQL at {pg_config['host']}:{pg_config['port']}")
         except Exception as e:
             print(f"Error connecting to PostgreSQL: {e}")
-            mysql_conn.close()
             sys.exit(1)
 
     try:
@@ -607,40 +890,21 @@ def main():
         if pg_conn:
             create_schemas(pg_conn, args.dry_run)
 
-        # Step 4: Migrate core tables
-        print("\n=== Step 3: Migrating Core Tables ===\n")
-
-        tables_to_migrate = args.tables if args.tables else None
-
-        if not tables_to_migrate or 'bible_book' in tables_to_migrate:
-            print("Migrating bible_book...")
-            migrate_bible_book(mysql_cur, pg_conn, args.batch_size,
-                               mysql_config['database'], args.dry_run)
-
-        if not tables_to_migrate or 'bible_books' in tables_to_migrate:
-            print("Migrating bible_books...")
-            migrate_bible_books(mysql_cur, pg_conn, args.batch_size,
-                                mysql_config['database'], args.dry_run)
-
-        if not tables_to_migrate or 'bible_search' in tables_to_migrate:
-            print("Migrating bible_search...")
-            migrate_bible_search(mysql_cur, pg_conn, args.batch_size,
-                                 mysql_config['database'], args.dry_run)
-
-        if not tables_to_migrate or 'bible_multi_search' in tables_to_migrate:
-            print("Migrating bible_multi_search...")
-            migrate_bible_multi_search(mysql_cur, pg_conn, args.batch_size,
-                                       mysql_config['database'], args.dry_run)
-
-        # Step 5: Migrate translation tables
-        if not args.skip_translations:
-            print("\n=== Step 4: Migrating Translation Tables ===\n")
-            for table_name in TRANSLATION_TABLES:
-                if not tables_to_migrate or table_name in tables_to_migrate:
-                    print(f"Migrating {table_name}...")
-                    migrate_translation_table(mysql_cur, pg_conn, table_name,
-                                              args.batch_size, mysql_config['database'],
-                                              args.dry_run)
+        # Step 4: Migrate all selected tables
+        print("\n=== Step 3: Migrating Tables ===\n")
+
+        wanted = set(args.tables) if args.tables else None
+        skipped = set(TRANSLATION_TABLES) if args.skip_translations else set()
+        migrations = [
+            (name, loader) for name, loader in MIGRATIONS
+            if (not wanted or name in wanted) and name not in skipped
+        ]
+        run_migrations(mysql_config, pg_config, migrations,
+                       args.batch_size, args.workers, args.dry_run)
+
+        # Step 5: Build full-text search indexes over the loaded core tables
+        if pg_conn:
+            create_post_load_indexes(pg_conn, args.dry_run)
 
         print("\n" + "=" * 60)
         if args.dry_run:
@@ -653,8 +917,6 @@ def main():
         print(f"\nMigration failed with error: {e}")
         sys.exit(1)
     finally:
-        mysql_cur.close()
-        mysql_conn.close()
         if pg_conn:
             pg_conn.close()
         print("\nDatabase connections closed.")
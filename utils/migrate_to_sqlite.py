@@ -6,7 +6,7 @@ This script migrates all tables and data from MySQL to SQLite.
 Designed for Ubuntu 24.04 VPS.
 
 Requirements:
-    pip install pymysql
+    pip install pymysql  (or mysqlclient, with --mysql-driver mysqlclient)
 
 Usage:
     python3 migrate_to_sqlite.py --help
@@ -18,8 +18,14 @@ import argparse
 import os
 import sqlite3
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
 from datetime import date
-from typing import List, Tuple
+from itertools import chain
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.request import pathname2url
 
 # ============================================================================
 # TRANSLATION TABLES - All bible_book_{translation} tables
@@ -48,6 +54,12 @@ TRANSLATION_TABLES = [
     'bible_book_nstrunv',
 ]
 
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER: bound parameters allowed in
+# one statement, which caps rows per batch at this // columns. Only used when
+# the connection can't report its own limit (Python < 3.11)
+SQLITE_MAX_VARS = 32766
+SQLITE_MAX_VARS_BEFORE_3_32 = 999
+
 # ============================================================================
 # SCHEMA DEFINITIONS
 # ============================================================================
@@ -72,7 +84,7 @@ CREATE TABLE IF NOT EXISTS bible_book (
 );
 """
 
-SCHEMA_BIBLE_BOOKS = """
+SCHEMA_BIBLE_BOOKS_TABLE = """
 CREATE TABLE IF NOT EXISTS bible_books (
     id       INTEGER,
     book     INTEGER      NOT NULL,
@@ -88,7 +100,11 @@ CREATE TABLE IF NOT EXISTS bible_books (
     likes    INTEGER      NOT NULL DEFAULT 0,
     PRIMARY KEY (book, chapter, verse)
 );
+"""
 
+# Secondary indexes, built once after the data is loaded rather than
+# maintained row by row during the load
+SCHEMA_BIBLE_BOOKS_INDEXES = """
 CREATE INDEX IF NOT EXISTS idx_bible_books_short ON bible_books(short);
 """
 
@@ -102,6 +118,18 @@ CREATE TABLE IF NOT EXISTS bible_search (
 );
 """
 
+# Like counters, split out of bible_books (migrations/002_bible_likes.sql);
+# bible_books.likes is no longer written after that migration
+SCHEMA_BIBLE_LIKES = """
+CREATE TABLE IF NOT EXISTS bible_likes (
+    book    INTEGER      NOT NULL,
+    chapter INTEGER      NOT NULL,
+    verse   INTEGER      NOT NULL,
+    likes   INTEGER      NOT NULL DEFAULT 0,
+    PRIMARY KEY (book, chapter, verse)
+);
+"""
+
 SCHEMA_BIBLE_MULTI_SEARCH = """
 CREATE TABLE IF NOT EXISTS bible_multi_search (
     book    INTEGER      NOT NULL,
@@ -113,7 +141,7 @@ CREATE TABLE IF NOT EXISTS bible_multi_search (
 """
 
 # FTS5 Virtual Tables for Full-Text Search
-SCHEMA_FTS_BIBLE_BOOKS = """
+SCHEMA_FTS_BIBLE_BOOKS_VTABLE = """
 CREATE VIRTUAL TABLE IF NOT EXISTS bible_books_fts USING fts5(
     txt_tw,
     txt_cn,
@@ -122,8 +150,10 @@ CREATE VIRTUAL TABLE IF NOT EXISTS bible_books_fts USING fts5(
     content='bible_books',
     content_rowid='rowid'
 );
+"""
 
--- Triggers to keep FTS index in sync
+# Triggers to keep FTS index in sync; created only after the bulk load
+SCHEMA_FTS_BIBLE_BOOKS_TRIGGERS = """
 CREATE TRIGGER IF NOT EXISTS bible_books_ai AFTER INSERT ON bible_books BEGIN
     INSERT INTO bible_books_fts(rowid, txt_tw, txt_cn, txt_en, txt_py)
     VALUES (new.rowid, new.txt_tw, new.txt_cn, new.txt_en, new.txt_py);
@@ -142,14 +172,16 @@ CREATE TRIGGER IF NOT EXISTS bible_books_au AFTER UPDATE ON bible_books BEGIN
 END;
 """
 
-SCHEMA_FTS_BIBLE_SEARCH = """
+SCHEMA_FTS_BIBLE_SEARCH_VTABLE = """
 CREATE VIRTUAL TABLE IF NOT EXISTS bible_search_fts USING fts5(
     txt,
     content='bible_search',
     content_rowid='rowid'
 );
+"""
 
--- Triggers to keep FTS index in sync
+# Triggers to keep FTS index in sync; created only after the bulk load
+SCHEMA_FTS_BIBLE_SEARCH_TRIGGERS = """
 CREATE TRIGGER IF NOT EXISTS bible_search_ai AFTER INSERT ON bible_search BEGIN
     INSERT INTO bible_search_fts(rowid, txt) VALUES (new.rowid, new.txt);
 END;
@@ -166,14 +198,16 @@ CREATE TRIGGER IF NOT EXISTS bible_search_au AFTER UPDATE ON bible_search BEGIN
 END;
 """
 
-SCHEMA_FTS_MULTI_SEARCH = """
+SCHEMA_FTS_MULTI_SEARCH_VTABLE = """
 CREATE VIRTUAL TABLE IF NOT EXISTS bible_multi_search_fts USING fts5(
     txt,
     content='bible_multi_search',
     content_rowid='rowid'
 );
+"""
 
--- Triggers to keep FTS index in sync
+# Triggers to keep FTS index in sync; created only after the bulk load
+SCHEMA_FTS_MULTI_SEARCH_TRIGGERS = """
 CREATE TRIGGER IF NOT EXISTS bible_multi_search_ai AFTER INSERT ON bible_multi_search BEGIN
     INSERT INTO bible_multi_search_fts(rowid, txt) VALUES (new.rowid, new.txt);
 END;
@@ -190,6 +224,13 @@ CREATE TRIGGER IF NOT EXISTS bible_multi_search_au AFTER UPDATE ON bible_multi_s
 END;
 """
 
+# Trigger names, dropped before a reload so they do not fire per row
+FTS_TRIGGERS = [
+    f'{table}_{suffix}'
+    for table in ('bible_books', 'bible_search', 'bible_multi_search')
+    for suffix in ('ai', 'ad', 'au')
+]
+
 # Template for translation tables
 SCHEMA_TRANSLATION_TABLE = """
 CREATE TABLE IF NOT EXISTS {table_name} (
@@ -241,9 +282,13 @@ Examples:
   # Custom batch size for large datasets
   python3 %(prog)s --batch-size 5000
 
+  # Re-migrate from an existing SQLite snapshot (no MySQL needed)
+  python3 %(prog)s --sqlite-source ./snapshot.db --sqlite-path ./bible.db
+
 Tables Migrated:
   - bible_book        : Book metadata (66 books)
-  - bible_books       : Main verses table with likes
+  - bible_books       : Main verses table
+  - bible_likes       : Like counters
   - bible_search      : Full-text search index
   - bible_multi_search: Multi-language search index
   - bible_book_*      : 20+ translation tables (KJV, CUVS, etc.)
@@ -283,6 +328,13 @@ FTS5 Virtual Tables (for full-text search):
         default=os.environ.get('MYSQL_DATABASE', 'bible'),
         help='MySQL database name (default: bible, env: MYSQL_DATABASE)'
     )
+    mysql_group.add_argument(
+        '--mysql-driver',
+        choices=['pymysql', 'mysqlclient'],
+        default=os.environ.get('MYSQL_DRIVER', 'pymysql'),
+        help='MySQL client library; mysqlclient is faster but needs a C build '
+             '(default: pymysql, env: MYSQL_DRIVER)'
+    )
 
     # SQLite options
     sqlite_group = parser.add_argument_group('SQLite Options')
@@ -291,14 +343,31 @@ FTS5 Virtual Tables (for full-text search):
         default=os.environ.get('SQLITE_PATH', './bible.db'),
         help='SQLite database file path (default: ./bible.db, env: SQLITE_PATH)'
     )
+    sqlite_group.add_argument(
+        '--sqlite-source',
+        help='Copy from an existing SQLite mirror instead of MySQL '
+             '(MySQL options are ignored)'
+    )
+    sqlite_group.add_argument(
+        '--always-vacuum',
+        action='store_true',
+        help='Run VACUUM even when the database file was created by this run'
+    )
 
     # Migration options
     migration_group = parser.add_argument_group('Migration Options')
     migration_group.add_argument(
         '--batch-size',
         type=int,
-        default=1000,
-        help='Batch size for bulk inserts (default: 1000)'
+        default=None,
+        help='Batch size for bulk inserts (default: as many rows as fit in '
+             "SQLite's bound-parameter limit, per table)"
+    )
+    migration_group.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Translation tables read from MySQL in parallel (default: 4)'
     )
     migration_group.add_argument(
         '--dry-run',
@@ -336,7 +405,7 @@ DESCRIPTION:
     It creates the schema, transfers all data, and sets up FTS5 full-text search.
 
 REQUIREMENTS:
-    pip install pymysql
+    pip install pymysql  (or mysqlclient, with --mysql-driver mysqlclient)
     (sqlite3 is included in Python standard library)
 
 QUICK START:
@@ -348,12 +417,14 @@ FEATURES:
     - FTS5 full-text search with auto-sync triggers
     - WAL mode for better concurrent access
     - Batch inserts for performance
-    - VACUUM and ANALYZE optimization
+    - --sqlite-source copies from an existing SQLite mirror without MySQL
+    - VACUUM (existing files only) and ANALYZE optimization
 
 DATABASE SCHEMA:
     Core Tables:
         bible_book         - Book metadata (id, names in EN/CN/TW)
-        bible_books        - Main verses with likes count
+        bible_books        - Main verses
+        bible_likes        - Like counters
         bible_search       - Full-text search index
         bible_multi_search - Multi-language search
 
@@ -364,7 +435,8 @@ DATABASE SCHEMA:
         bible_books_fts, bible_search_fts, bible_multi_search_fts
 
 ENVIRONMENT VARIABLES:
-    MYSQL_HOST, MYSQL_PORT, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DATABASE
+    MYSQL_HOST, MYSQL_PORT, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DATABASE,
+    MYSQL_DRIVER
     SQLITE_PATH
 
 SQLITE USAGE:
@@ -386,15 +458,25 @@ For full options, run: python3 migrate_to_sqlite.py --help
 # ============================================================================
 
 def get_mysql_connection(config: dict):
-    """Create MySQL connection."""
-    import pymysql
-    return pymysql.connect(
+    """Create MySQL connection.
+
+    Uses an unbuffered server-side cursor (SSCursor) so table rows are
+    streamed rather than loaded into memory all at once. config['driver']
+    picks pymysql or mysqlclient (MySQLdb), whose C row decoding is several
+    times faster; both expose the same connect() and cursor API.
+    """
+    if config.get('driver') == 'mysqlclient':
+        import MySQLdb as driver
+    else:
+        import pymysql as driver
+    return driver.connect(
         host=config['host'],
         port=config['port'],
         user=config['user'],
         password=config['password'],
         database=config['database'],
-        charset='utf8mb4'
+        charset='utf8mb4',
+        cursorclass=driver.cursors.SSCursor
     )
 
 
@@ -405,34 +487,121 @@ def get_sqlite_connection(db_path: str):
         os.makedirs(db_dir, exist_ok=True)
         print(f"Created directory: {db_dir}")
 
-    conn = sqlite3.connect(db_path)
+    # Autocommit mode: transactions are opened explicitly (BEGIN IMMEDIATE)
+    # so each table loads in exactly one transaction. Translation-table
+    # workers share this connection, serialized by a lock
+    # uri=True lets --sqlite-source be attached read-only; a plain path is
+    # still opened as a file name
+    conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False,
+                           uri=True)
     conn.execute("PRAGMA foreign_keys = ON")
+    # Only takes effect on a new file, so it must precede WAL and any table;
+    # 8 KiB pages keep the verse-text b-trees shallower
+    conn.execute("PRAGMA page_size = 8192")
     conn.execute("PRAGMA journal_mode = WAL")
     conn.execute("PRAGMA synchronous = NORMAL")
     conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
     return conn
 
 
-def table_exists_mysql(cur, database: str, table_name: str) -> bool:
-    """Check if a table exists in MySQL."""
+def get_sqlite_max_vars(conn) -> int:
+    """Get the most bound parameters one statement may use on conn."""
+    if hasattr(conn, 'getlimit'):  # Python 3.11+
+        return conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    if sqlite3.sqlite_version_info < (3, 32, 0):
+        return SQLITE_MAX_VARS_BEFORE_3_32
+    return SQLITE_MAX_VARS
+
+
+@contextmanager
+def bulk_load_pragmas(conn):
+    """Trade durability for speed while the database is being (re)built.
+
+    The migration can simply be rerun after a crash, so the journal is kept
+    in memory and fsyncs are skipped. The production settings from
+    get_sqlite_connection are restored on exit, before VACUUM. A no-op when
+    conn is None (dry run).
+
+    Only main is locked EXCLUSIVE. The unqualified pragma would also become
+    the mode of databases attached later, and a read-only attach of a WAL
+    file (--sqlite-source) fails under EXCLUSIVE with "disk I/O error".
+    """
+    if conn is None:
+        yield
+        return
+
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+    cache_size = conn.execute("PRAGMA cache_size").fetchone()[0]
+    conn.execute("PRAGMA journal_mode = MEMORY")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA main.locking_mode = EXCLUSIVE")
+    conn.execute("PRAGMA mmap_size = 268435456")  # 256MB
+    conn.execute("PRAGMA cache_size = -262144")  # 256MB
+    try:
+        yield
+    finally:
+        # NORMAL locking first so the exclusive lock is released and WAL
+        # can be re-enabled
+        conn.execute("PRAGMA main.locking_mode = NORMAL")
+        conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {synchronous}")
+        conn.execute("PRAGMA temp_store = DEFAULT")
+        conn.execute("PRAGMA mmap_size = 0")
+        conn.execute(f"PRAGMA cache_size = {cache_size}")
+
+
+def get_table_rows_estimate(cur, database: str, table_name: str) -> Optional[int]:
+    """Get the approximate row count of a MySQL table, or None if it does not exist.
+
+    Reads the statistics in information_schema instead of running COUNT(*),
+    which would scan the whole InnoDB table.
+    """
     cur.execute("""
-        SELECT COUNT(*) FROM information_schema.tables
+        SELECT TABLE_ROWS FROM information_schema.tables
         WHERE table_schema = %s AND table_name = %s
     """, (database, table_name))
-    return cur.fetchone()[0] > 0
-
+    row = cur.fetchone()
+    return None if row is None else (row[0] or 0)
 
-def get_row_count(cur, table_name: str) -> int:
-    """Get row count from a table."""
-    cur.execute(f"SELECT COUNT(*) FROM `{table_name}`")
-    return cur.fetchone()[0]
 
+def iter_rows(cur, spec: 'MigrationSpec', batch_size: int) -> Iterator[List[Tuple]]:
+    """Yield rows of a MySQL table in chunks of up to batch_size rows.
 
-def fetch_all_data(cur, table_name: str, columns: List[str]) -> List[Tuple]:
-    """Fetch all data from a MySQL table."""
-    cols = ', '.join(f'`{c}`' for c in columns)
-    cur.execute(f"SELECT {cols} FROM `{table_name}`")
-    return cur.fetchall()
+    The spec's converters are applied as rows stream past, by column
+    index, so columns without one are never looked at.
+    """
+    converters = spec.converters
+    cur.execute(spec.select_sql)
+    while True:
+        rows = cur.fetchmany(batch_size)
+        if not rows:
+            break
+        if converters:
+            converted = []
+            for row in rows:
+                row = list(row)
+                for i, conv in converters:
+                    row[i] = conv(row[i])
+                converted.append(row)
+            rows = converted
+        yield rows
+
+
+def multi_row_insert(execute: Callable, spec: 'MigrationSpec', rows: List[Tuple]):
+    """Insert rows with one multi-row INSERT statement.
+
+    One statement steps through the whole batch in C instead of once per row
+    as executemany does; rows * len(columns) must stay within
+    get_sqlite_max_vars.
+    Full batches produce the same SQL text and so reuse the cached statement.
+    Plain INSERT, not OR REPLACE: migrate_table empties the table first, so
+    there is never a row to replace. execute is the bound execute method of
+    the migration's SQLite cursor.
+    """
+    sql = spec.insert_prefix + ', '.join([spec.row_params] * len(rows))
+    execute(sql, list(chain.from_iterable(rows)))
 
 
 def convert_date(value):
@@ -446,77 +615,162 @@ def convert_date(value):
 
 def migrate_table(
     mysql_cur,
-    sqlite_conn,
-    table_name: str,
-    columns: List[str],
-    insert_sql: str,
-    batch_size: int,
+    sqlite_cur,
+    spec: 'MigrationSpec',
+    batch_size: Optional[int],
     database: str,
-    has_date_columns: bool = False,
-    dry_run: bool = False
+    dry_run: bool = False,
+    lock: Optional[threading.Lock] = None
 ):
-    """Migrate data from MySQL table to SQLite."""
-    if not table_exists_mysql(mysql_cur, database, table_name):
+    """Migrate data from MySQL table to SQLite.
+
+    sqlite_cur is the single cursor main() opens for the whole migration.
+    Runs in its own transaction, unless a lock is given: then the caller
+    owns the transaction on a cursor shared between threads, and every
+    SQLite write is made while holding the lock. Progress is reported about
+    every 1% of rows, and only without a lock, where no other table's output
+    can interleave with it.
+    """
+    table_name = spec.table_name
+    row_estimate = get_table_rows_estimate(mysql_cur, database, table_name)
+    if row_estimate is None:
         print(f"  Table '{table_name}' does not exist in MySQL, skipping...")
         return
 
-    row_count = get_row_count(mysql_cur, table_name)
-    print(f"  Migrating {row_count} rows from '{table_name}'...")
-
     if dry_run:
-        print(f"  [DRY RUN] Would migrate {row_count} rows")
+        print(f"  [DRY RUN] Would migrate about {row_estimate} rows from '{table_name}'")
         return
 
-    if row_count == 0:
-        print(f"  No data in '{table_name}', skipping...")
-        return
-
-    data = fetch_all_data(mysql_cur, table_name, columns)
+    print(f"  Migrating about {row_estimate} rows from '{table_name}'...")
 
-    # Convert dates if needed
-    if has_date_columns:
-        converted_data = []
-        for row in data:
-            converted_row = tuple(convert_date(v) if isinstance(v, date) else v for v in row)
-            converted_data.append(converted_row)
-        data = converted_data
+    # Batches never exceed SQLite's bound-parameter limit, so narrow tables
+    # get far larger batches than wide ones
+    max_batch = get_sqlite_max_vars(sqlite_cur.connection) // len(spec.columns)
+    effective_batch = min(batch_size or max_batch, max_batch)
+    print(f"  Batch size: {effective_batch} rows")
 
-    sqlite_cur = sqlite_conn.cursor()
+    own_transaction = lock is None
+    write_lock = lock or nullcontext()
+    execute = sqlite_cur.execute
+    # Throttled to ~100 writes per table however small the batches are
+    write = sys.stdout.write if own_transaction and row_estimate else None
+    progress_every = max(1, row_estimate // 100)
+    next_progress = progress_every
 
     try:
-        sqlite_cur.execute(f'DELETE FROM "{table_name}"')
-
-        for i in range(0, len(data), batch_size):
-            batch = data[i:i + batch_size]
-            sqlite_cur.executemany(insert_sql, batch)
-
-        sqlite_conn.commit()
-        print(f"  Successfully migrated {len(data)} rows to '{table_name}'")
+        if own_transaction:
+            execute("BEGIN IMMEDIATE")
+        with write_lock:
+            execute(f'DELETE FROM "{table_name}"')
+
+        migrated = 0
+        # MySQL fetches run outside the lock, overlapping other tables' writes
+        for batch in iter_rows(mysql_cur, spec, effective_batch):
+            with write_lock:
+                multi_row_insert(execute, spec, batch)
+            migrated += len(batch)
+            if write and migrated >= next_progress:
+                write(f"\r  {migrated}/~{row_estimate} rows")
+                sys.stdout.flush()
+                next_progress = migrated + progress_every
+
+        if own_transaction:
+            execute("COMMIT")
+        if write and migrated:
+            write("\n")
+        if migrated == 0:
+            print(f"  No data in '{table_name}'")
+        else:
+            print(f"  Successfully migrated {migrated} rows to '{table_name}'")
     except Exception as e:
-        sqlite_conn.rollback()
+        if own_transaction and sqlite_cur.connection.in_transaction:
+            execute("ROLLBACK")
         print(f"  Error migrating '{table_name}': {e}")
         raise
 
 
-def rebuild_fts_index(sqlite_conn, fts_table: str, source_table: str, columns: List[str]):
-    """Rebuild FTS index from source table."""
+def rebuild_fts_index(sqlite_conn, fts_table: str):
+    """Rebuild an external-content FTS index from its source table."""
     print(f"  Rebuilding FTS index for {fts_table}...")
     cur = sqlite_conn.cursor()
 
     try:
-        cur.execute(f"DELETE FROM {fts_table}")
-        col_list = ', '.join(columns)
-        cur.execute(f"""
-            INSERT INTO {fts_table}(rowid, {col_list})
-            SELECT rowid, {col_list} FROM {source_table}
-        """)
-        sqlite_conn.commit()
+        # FTS5's native rebuild re-reads the whole content table in one pass
+        cur.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+        # Merge the freshly built index b-trees into a single segment
+        cur.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('optimize')")
         print(f"  FTS index rebuilt for {fts_table}")
     except Exception as e:
         print(f"  Error rebuilding FTS index: {e}")
         raise
 
 
+# ============================================================================
+# MIGRATION PLAN
+# ============================================================================
+
+@dataclass(frozen=True)
+class MigrationSpec:
+    """Prepared SQL and per-column converters for migrating one table."""
+    table_name: str
+    columns: Tuple[str, ...]
+    select_sql: str
+    insert_prefix: str  # INSERT ... VALUES, followed by one row_params per row
+    row_params: str
+    converters: Optional[Tuple[Tuple[int, Callable], ...]] = None  # (column index, fn)
+
+
+def _build_spec(table_name: str, columns: Tuple[str, ...], primary_key: Tuple[str, ...],
+                converters: Optional[Dict[str, Callable]] = None) -> MigrationSpec:
+    """Prepare the SELECT and INSERT strings for one table.
+
+    Rows are read in primary key order, which MySQL serves from its PK index,
+    so every insert appends to the rightmost leaf of SQLite's PK b-tree
+    instead of splitting pages mid-tree.
+    """
+    mysql_cols = ', '.join(f'`{c}`' for c in columns)
+    order_by = ', '.join(f'`{c}`' for c in primary_key)
+    sqlite_cols = ', '.join(f'"{c}"' for c in columns)
+    return MigrationSpec(
+        table_name=table_name,
+        columns=columns,
+        select_sql=f"SELECT {mysql_cols} FROM `{table_name}` ORDER BY {order_by}",
+        insert_prefix=f'INSERT INTO "{table_name}" ({sqlite_cols}) VALUES ',
+        row_params='(' + ', '.join(['?'] * len(columns)) + ')',
+        converters=tuple(
+            (i, converters[c]) for i, c in enumerate(columns) if c in converters
+        ) if converters else None,
+    )
+
+
+def _build_plan() -> Dict[str, MigrationSpec]:
+    """Build the migration spec of every table, in migration order."""
+    search_columns = ('book', 'chapter', 'verse', 'txt')
+    verse_key = ('book', 'chapter', 'verse')
+    specs = [
+        _build_spec('bible_book', (
+            'id', 'en', 'english', 'english2', 'en1', 'en2', 'en3',
+            'short', 'chinese', 'cn', 'taiwan', 'tw', 'abbr', 'count', 'offset',
+        ), ('id',)),
+        _build_spec('bible_books', (
+            'id', 'book', 'chapter', 'verse', 'txt_tw', 'txt_cn',
+            'txt_en', 'txt_py', 'short', 'updated', 'reported', 'likes',
+        ), verse_key, converters={'updated': convert_date, 'reported': convert_date}),
+        _build_spec('bible_likes', ('book', 'chapter', 'verse', 'likes'), verse_key),
+        _build_spec('bible_search', search_columns, verse_key),
+        _build_spec('bible_multi_search', search_columns, verse_key),
+    ]
+    specs += [
+        _build_spec(table_name, ('Book', 'Chapter', 'Verse', 'Scripture'),
+                    ('Book', 'Chapter', 'Verse'))
+        for table_name in TRANSLATION_TABLES
+    ]
+    return {spec.table_name: spec for spec in specs}
+
+
+MIGRATION_PLAN = _build_plan()
+
+
 # ============================================================================
 # MAIN MIGRATION FUNCTIONS
 # ============================================================================
@@ -529,26 +783,36 @@ def create_schemas(sqlite_conn, dry_run: bool = False):
         print("[DRY RUN] Would create all schemas")
         return
 
-    cur = sqlite_conn.cursor()
-
-    print("Creating bible_book...")
-    cur.executescript(SCHEMA_BIBLE_BOOK)
+    # All DDL goes to SQLite as one script
+    ddl = [
+        SCHEMA_BIBLE_BOOK,
+        SCHEMA_BIBLE_BOOKS_TABLE,
+        # An index from an earlier run would be updated on every insert
+        "DROP INDEX IF EXISTS idx_bible_books_short;",
+        SCHEMA_BIBLE_LIKES,
+        SCHEMA_BIBLE_SEARCH,
+        SCHEMA_BIBLE_MULTI_SEARCH,
+        *(SCHEMA_TRANSLATION_TABLE.format(table_name=table_name)
+          for table_name in TRANSLATION_TABLES),
+    ]
+    print("Creating bible_book, bible_books, bible_likes, bible_search, "
+          f"bible_multi_search and {len(TRANSLATION_TABLES)} translation tables...")
+    sqlite_conn.executescript('\n'.join(ddl))
 
-    print("Creating bible_books...")
-    cur.executescript(SCHEMA_BIBLE_BOOKS)
+    print("\nAll schemas created successfully.")
 
-    print("Creating bible_search...")
-    cur.executescript(SCHEMA_BIBLE_SEARCH)
 
-    print("Creating bible_multi_search...")
-    cur.executescript(SCHEMA_BIBLE_MULTI_SEARCH)
+def create_indexes(sqlite_conn, dry_run: bool = False):
+    """Create secondary indexes once all data is loaded."""
+    print("\n=== Creating Indexes ===\n")
 
-    for table_name in TRANSLATION_TABLES:
-        print(f"Creating {table_name}...")
-        cur.execute(SCHEMA_TRANSLATION_TABLE.format(table_name=table_name))
+    if dry_run:
+        print("[DRY RUN] Would create indexes")
+        return
 
-    sqlite_conn.commit()
-    print("\nAll schemas created successfully.")
+    print("Creating idx_bible_books_short...")
+    sqlite_conn.executescript(SCHEMA_BIBLE_BOOKS_INDEXES)
+    print("\nIndexes created successfully.")
 
 
 def create_fts_tables(sqlite_conn, dry_run: bool = False):
@@ -562,80 +826,126 @@ def create_fts_tables(sqlite_conn, dry_run: bool = False):
     cur = sqlite_conn.cursor()
 
     print("Creating bible_books_fts...")
-    cur.executescript(SCHEMA_FTS_BIBLE_BOOKS)
+    cur.executescript(SCHEMA_FTS_BIBLE_BOOKS_VTABLE)
 
     print("Creating bible_search_fts...")
-    cur.executescript(SCHEMA_FTS_BIBLE_SEARCH)
+    cur.executescript(SCHEMA_FTS_BIBLE_SEARCH_VTABLE)
 
     print("Creating bible_multi_search_fts...")
-    cur.executescript(SCHEMA_FTS_MULTI_SEARCH)
+    cur.executescript(SCHEMA_FTS_MULTI_SEARCH_VTABLE)
 
-    sqlite_conn.commit()
     print("\nFTS tables created successfully.")
 
 
-def migrate_bible_book(mysql_cur, sqlite_conn, batch_size: int, database: str, dry_run: bool):
-    """Migrate bible_book table."""
-    columns = ['id', 'en', 'english', 'english2', 'en1', 'en2', 'en3',
-               'short', 'chinese', 'cn', 'taiwan', 'tw', 'abbr', 'count', 'offset']
+def drop_fts_triggers(sqlite_conn, dry_run: bool = False):
+    """Drop FTS sync triggers left by an earlier run before reloading data."""
+    if dry_run:
+        return
 
-    insert_sql = """
-        INSERT OR REPLACE INTO bible_book
-        (id, en, english, english2, en1, en2, en3, short, chinese, cn,
-         taiwan, tw, abbr, count, "offset")
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """
-    migrate_table(mysql_cur, sqlite_conn, 'bible_book', columns, insert_sql,
-                  batch_size, database, dry_run=dry_run)
+    for trigger in FTS_TRIGGERS:
+        sqlite_conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
 
 
-def migrate_bible_books(mysql_cur, sqlite_conn, batch_size: int, database: str, dry_run: bool):
-    """Migrate bible_books table."""
-    columns = ['id', 'book', 'chapter', 'verse', 'txt_tw', 'txt_cn',
-               'txt_en', 'txt_py', 'short', 'updated', 'reported', 'likes']
+def create_fts_triggers(sqlite_conn, dry_run: bool = False):
+    """Create the triggers that keep FTS indexes in sync after migration."""
+    print("\n=== Creating FTS Sync Triggers ===\n")
 
-    insert_sql = """
-        INSERT OR REPLACE INTO bible_books
-        (id, book, chapter, verse, txt_tw, txt_cn, txt_en, txt_py,
-         short, updated, reported, likes)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """
-    migrate_table(mysql_cur, sqlite_conn, 'bible_books', columns, insert_sql,
-                  batch_size, database, has_date_columns=True, dry_run=dry_run)
+    if dry_run:
+        print("[DRY RUN] Would create FTS sync triggers")
+        return
+
+    cur = sqlite_conn.cursor()
+    cur.executescript(SCHEMA_FTS_BIBLE_BOOKS_TRIGGERS)
+    cur.executescript(SCHEMA_FTS_BIBLE_SEARCH_TRIGGERS)
+    cur.executescript(SCHEMA_FTS_MULTI_SEARCH_TRIGGERS)
 
+    print("FTS sync triggers created successfully.")
 
-def migrate_bible_search(mysql_cur, sqlite_conn, batch_size: int, database: str, dry_run: bool):
-    """Migrate bible_search table."""
-    columns = ['book', 'chapter', 'verse', 'txt']
-    insert_sql = """
-        INSERT OR REPLACE INTO bible_search (book, chapter, verse, txt)
-        VALUES (?, ?, ?, ?)
-    """
-    migrate_table(mysql_cur, sqlite_conn, 'bible_search', columns, insert_sql,
-                  batch_size, database, dry_run=dry_run)
 
+def migrate_translation_table_worker(mysql_config: dict, sqlite_cur, lock: threading.Lock,
+                                     table_name: str, batch_size: int, dry_run: bool):
+    """Migrate a translation table from a worker thread on its own MySQL connection."""
+    print(f"Migrating {table_name}...")
+    mysql_conn = get_mysql_connection(mysql_config)
+    try:
+        mysql_cur = mysql_conn.cursor()
+        migrate_table(mysql_cur, sqlite_cur, MIGRATION_PLAN[table_name], batch_size,
+                      mysql_config['database'], dry_run, lock=lock)
+        mysql_cur.close()
+    finally:
+        mysql_conn.close()
 
-def migrate_bible_multi_search(mysql_cur, sqlite_conn, batch_size: int, database: str, dry_run: bool):
-    """Migrate bible_multi_search table."""
-    columns = ['book', 'chapter', 'verse', 'txt']
-    insert_sql = """
-        INSERT OR REPLACE INTO bible_multi_search (book, chapter, verse, txt)
-        VALUES (?, ?, ?, ?)
+
+def migrate_translation_tables(mysql_config: dict, sqlite_cur, tables: List[str],
+                               batch_size: int, workers: int, dry_run: bool):
+    """Migrate translation tables concurrently in one SQLite transaction.
+
+    Workers read from MySQL in parallel; their SQLite writes share one
+    cursor and are serialized by a lock.
     """
-    migrate_table(mysql_cur, sqlite_conn, 'bible_multi_search', columns, insert_sql,
-                  batch_size, database, dry_run=dry_run)
+    lock = threading.Lock()
+    sqlite_conn = sqlite_cur.connection if sqlite_cur else None
+    if sqlite_conn and not dry_run:
+        sqlite_cur.execute("BEGIN IMMEDIATE")
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = [
+                pool.submit(migrate_translation_table_worker, mysql_config, sqlite_cur,
+                            lock, table_name, batch_size, dry_run)
+                for table_name in tables
+            ]
+            # Re-raise the first failure once every worker has finished
+            for future in futures:
+                future.result()
+        if sqlite_conn and sqlite_conn.in_transaction:
+            sqlite_cur.execute("COMMIT")
+    except Exception:
+        if sqlite_conn and sqlite_conn.in_transaction:
+            sqlite_cur.execute("ROLLBACK")
+        raise
 
 
-def migrate_translation_table(mysql_cur, sqlite_conn, table_name: str, batch_size: int,
-                               database: str, dry_run: bool):
-    """Migrate a translation table."""
-    columns = ['Book', 'Chapter', 'Verse', 'Scripture']
-    insert_sql = f"""
-        INSERT OR REPLACE INTO "{table_name}" (Book, Chapter, Verse, Scripture)
-        VALUES (?, ?, ?, ?)
+def copy_from_sqlite_source(sqlite_cur, source_path: str, tables: List[str],
+                            dry_run: bool = False):
+    """Copy tables from an attached SQLite database in one transaction.
+
+    Each table is a single INSERT ... SELECT run entirely inside SQLite,
+    with no Python work per row. The source is attached read-only, so it is
+    never created or modified.
     """
-    migrate_table(mysql_cur, sqlite_conn, table_name, columns, insert_sql,
-                  batch_size, database, dry_run=dry_run)
+    if dry_run:
+        print(f"[DRY RUN] Would copy {len(tables)} tables from {source_path}")
+        return
+
+    source_uri = f"file:{pathname2url(os.path.abspath(source_path))}?mode=ro"
+    # Attached in NORMAL locking mode; bulk_load_pragmas only makes main
+    # EXCLUSIVE, which a read-only WAL source could not be opened under
+    sqlite_cur.execute("ATTACH DATABASE ? AS src", (source_uri,))
+    try:
+        sqlite_cur.execute("BEGIN IMMEDIATE")
+        try:
+            for table_name in tables:
+                sqlite_cur.execute(
+                    "SELECT 1 FROM src.sqlite_master WHERE type = 'table' AND name = ?",
+                    (table_name,)
+                )
+                if sqlite_cur.fetchone() is None:
+                    print(f"  Table '{table_name}' does not exist in source, skipping...")
+                    continue
+                cols = ', '.join(f'"{c}"' for c in MIGRATION_PLAN[table_name].columns)
+                sqlite_cur.execute(f'DELETE FROM main."{table_name}"')
+                sqlite_cur.execute(
+                    f'INSERT INTO main."{table_name}" ({cols}) '
+                    f'SELECT {cols} FROM src."{table_name}"'
+                )
+                print(f"  Copied {sqlite_cur.rowcount} rows to '{table_name}'")
+            sqlite_cur.execute("COMMIT")
+        except Exception:
+            if sqlite_cur.connection.in_transaction:
+                sqlite_cur.execute("ROLLBACK")
+            raise
+    finally:
+        sqlite_cur.execute("DETACH DATABASE src")
 
 
 def rebuild_all_fts_indexes(sqlite_conn, dry_run: bool = False):
@@ -646,10 +956,9 @@ def rebuild_all_fts_indexes(sqlite_conn, dry_run: bool = False):
         print("[DRY RUN] Would rebuild FTS indexes")
         return
 
-    rebuild_fts_index(sqlite_conn, 'bible_books_fts', 'bible_books',
-                      ['txt_tw', 'txt_cn', 'txt_en', 'txt_py'])
-    rebuild_fts_index(sqlite_conn, 'bible_search_fts', 'bible_search', ['txt'])
-    rebuild_fts_index(sqlite_conn, 'bible_multi_search_fts', 'bible_multi_search', ['txt'])
+    rebuild_fts_index(sqlite_conn, 'bible_books_fts')
+    rebuild_fts_index(sqlite_conn, 'bible_search_fts')
+    rebuild_fts_index(sqlite_conn, 'bible_multi_search_fts')
 
     print("\nAll FTS indexes rebuilt successfully.")
 
@@ -671,81 +980,115 @@ def main():
         'user': args.mysql_user,
         'password': args.mysql_password,
         'database': args.mysql_database,
+        'driver': args.mysql_driver,
     }
 
-    # Step 1: Connect to MySQL
+    if args.sqlite_source:
+        if not os.path.isfile(args.sqlite_source):
+            print(f"Error: SQLite source not found: {args.sqlite_source}")
+            sys.exit(1)
+        if os.path.abspath(args.sqlite_source) == os.path.abspath(args.sqlite_path):
+            print("Error: --sqlite-source must differ from --sqlite-path")
+            sys.exit(1)
+
+    # Step 1: Connect to MySQL (not needed when copying from a SQLite source)
     print("\n=== Step 1: Connecting to Databases ===\n")
-    try:
-        mysql_conn = get_mysql_connection(mysql_config)
-        mysql_cur = mysql_conn.cursor()
-        print(f"Connected to MySQL at {mysql_config['host']}:{mysql_config['port']}")
-    except Exception as e:
-        print(f"Error connecting to MySQL: {e}")
-        sys.exit(1)
+    mysql_conn = None
+    mysql_cur = None
+    if args.sqlite_source:
+        print(f"Reading from SQLite source: {args.sqlite_source}")
+    else:
+        try:
+            mysql_conn = get_mysql_connection(mysql_config)
+            mysql_cur = mysql_conn.cursor()
+            print(f"Connected to MySQL at {mysql_config['host']}:{mysql_config['port']}")
+        except Exception as e:
+            print(f"Error connecting to MySQL: {e}")
+            sys.exit(1)
 
     # Step 2: Create/Connect to SQLite
     sqlite_conn = None
+    sqlite_cur = None
+    # A file created by this run has no free pages for VACUUM to reclaim
+    fresh_db = not os.path.exists(args.sqlite_path)
     if not args.dry_run:
         try:
             sqlite_conn = get_sqlite_connection(args.sqlite_path)
+            # One cursor serves every table load, including the worker threads
+            sqlite_cur = sqlite_conn.cursor()
             print(f"SQLite database opened at: {args.sqlite_path}")
         except Exception as e:
             print(f"Error creating SQLite database: {e}")
-            mysql_conn.close()
+            if mysql_conn:
+                mysql_conn.close()
             sys.exit(1)
     else:
         print(f"[DRY RUN] Would create SQLite database at: {args.sqlite_path}")
 
     try:
-        # Step 3: Create schemas (without FTS first)
-        if sqlite_conn:
-            create_schemas(sqlite_conn, args.dry_run)
-
-        # Step 4: Migrate core tables
-        print("\n=== Step 2: Migrating Core Tables ===\n")
-
-        tables_to_migrate = args.tables if args.tables else None
-
-        if not tables_to_migrate or 'bible_book' in tables_to_migrate:
-            print("Migrating bible_book...")
-            migrate_bible_book(mysql_cur, sqlite_conn, args.batch_size,
-                               mysql_config['database'], args.dry_run)
-
-        if not tables_to_migrate or 'bible_books' in tables_to_migrate:
-            print("Migrating bible_books...")
-            migrate_bible_books(mysql_cur, sqlite_conn, args.batch_size,
-                                mysql_config['database'], args.dry_run)
-
-        if not tables_to_migrate or 'bible_search' in tables_to_migrate:
-            print("Migrating bible_search...")
-            migrate_bible_search(mysql_cur, sqlite_conn, args.batch_size,
-                                 mysql_config['database'], args.dry_run)
-
-        if not tables_to_migrate or 'bible_multi_search' in tables_to_migrate:
-            print("Migrating bible_multi_search...")
-            migrate_bible_multi_search(mysql_cur, sqlite_conn, args.batch_size,
-                                       mysql_config['database'], args.dry_run)
-
-        # Step 5: Migrate translation tables
-        if not args.skip_translations:
-            print("\n=== Step 3: Migrating Translation Tables ===\n")
-            for table_name in TRANSLATION_TABLES:
-                if not tables_to_migrate or table_name in tables_to_migrate:
-                    print(f"Migrating {table_name}...")
-                    migrate_translation_table(mysql_cur, sqlite_conn, table_name,
-                                              args.batch_size, mysql_config['database'],
-                                              args.dry_run)
-
-        # Step 6: Create FTS tables and rebuild indexes
-        if not args.skip_fts and sqlite_conn:
-            create_fts_tables(sqlite_conn, args.dry_run)
-            rebuild_all_fts_indexes(sqlite_conn, args.dry_run)
+        # Steps 3-6 run with bulk-load pragmas; production settings are
+        # restored before the database is optimized
+        with bulk_load_pragmas(sqlite_conn):
+            # Step 3: Create schemas (without FTS first)
+            if sqlite_conn:
+                create_schemas(sqlite_conn, args.dry_run)
+                # Triggers from an earlier run would index every row as it loads
+                if not args.skip_fts:
+                    drop_fts_triggers(sqlite_conn, args.dry_run)
+
+            tables_to_migrate = args.tables if args.tables else None
+
+            if args.sqlite_source:
+                # Steps 4-5: Copy everything inside SQLite
+                print("\n=== Step 2: Copying Tables from SQLite Source ===\n")
+                source_tables = [
+                    t for t in MIGRATION_PLAN
+                    if (not tables_to_migrate or t in tables_to_migrate)
+                    and not (args.skip_translations and t in TRANSLATION_TABLES)
+                ]
+                copy_from_sqlite_source(sqlite_cur, args.sqlite_source, source_tables,
+                                        args.dry_run)
+            else:
+                # Step 4: Migrate core tables
+                print("\n=== Step 2: Migrating Core Tables ===\n")
+
+                for table_name, spec in MIGRATION_PLAN.items():
+                    if table_name in TRANSLATION_TABLES:
+                        continue
+                    if not tables_to_migrate or table_name in tables_to_migrate:
+                        print(f"Migrating {table_name}...")
+                        migrate_table(mysql_cur, sqlite_cur, spec, args.batch_size,
+                                      mysql_config['database'], args.dry_run)
+
+                # Step 5: Migrate translation tables
+                if not args.skip_translations:
+                    print("\n=== Step 3: Migrating Translation Tables ===\n")
+                    translation_tables = [
+                        t for t in TRANSLATION_TABLES
+                        if not tables_to_migrate or t in tables_to_migrate
+                    ]
+                    migrate_translation_tables(mysql_config, sqlite_cur, translation_tables,
+                                               args.batch_size, args.workers, args.dry_run)
+
+            # Step 6: Create FTS tables and rebuild indexes
+            if not args.skip_fts and sqlite_conn:
+                create_fts_tables(sqlite_conn, args.dry_run)
+                rebuild_all_fts_indexes(sqlite_conn, args.dry_run)
+                create_fts_triggers(sqlite_conn, args.dry_run)
+
+            # Step 6b: Build secondary indexes over the loaded data
+            if sqlite_conn:
+                create_indexes(sqlite_conn, args.dry_run)
 
         # Step 7: Optimize database
         if sqlite_conn and not args.dry_run:
             print("\n=== Step 4: Optimizing Database ===\n")
-            print("Running VACUUM...")
-            sqlite_conn.execute("VACUUM")
+            if args.always_vacuum or not fresh_db:
+                print("Running VACUUM...")
+                sqlite_conn.execute("VACUUM")
+            else:
+                print("Skipping VACUUM on a freshly created database...")
+                sqlite_conn.execute("PRAGMA optimize")
             print("Running ANALYZE...")
             sqlite_conn.execute("ANALYZE")
 
@@ -765,8 +1108,9 @@ def main():
         print(f"\nMigration failed with error: {e}")
         sys.exit(1)
     finally:
-        mysql_cur.close()
-        mysql_conn.close()
+        if mysql_conn:
+            mysql_cur.close()
+            mysql_conn.close()
         if sqlite_conn:
             sqlite_conn.close()
         print("\nDatabase connections closed.")